@@ -12,31 +12,46 @@ Usage:
 
 import cadquery as cq
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 # Add paths for imports
 import sys
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(Path(__file__).parent))
+for _path in (project_root, Path(__file__).parent):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 from config import CONFIG, EnclosureConfig
 from frame import generate_body, generate_lid
-from semicad.export import export_step, export_stl, STLQuality
+from semicad.export import export_step, export_step_assembly, export_stl, mesh_model, STLQuality
 
+if TYPE_CHECKING:
+    # show_object is only available in cq-editor runtime
+    def show_object(obj: Any, name: str = "", options: dict[str, Any] | None = None) -> None: ...
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PositionedComponent:
     """A component with its position in the assembly."""
     name: str
     model: cq.Workplane
     position: tuple[float, float, float]
     color: str = "gray"
+    _positioned: cq.Workplane | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def positioned(self) -> cq.Workplane:
-        """Return the model translated to its position."""
-        return self.model.translate(self.position)
+        """Return the model placed at its position (computed once).
+
+        Placed with moved(), so the result shares geometry with the model
+        instead of copying it the way translate() does.
+        """
+        if self._positioned is None:
+            loc = cq.Location(cq.Vector(*self.position))
+            placed = cq.Workplane("XY").newObject([v.moved(loc) for v in self.model.vals()])
+            object.__setattr__(self, "_positioned", placed)
+        return self._positioned
 
 
 class EnclosureAssembly:
@@ -51,6 +66,7 @@ class EnclosureAssembly:
         self.components: list[PositionedComponent] = []
         self.body: cq.Workplane | None = None
         self.lid: cq.Workplane | None = None
+        self.lid_open = False
 
     def add_body(self) -> "EnclosureAssembly":
         """Add the enclosure body."""
@@ -66,6 +82,7 @@ class EnclosureAssembly:
     def add_lid(self, open_position: bool = False) -> "EnclosureAssembly":
         """Add the lid, optionally in open position."""
         self.lid = generate_lid(self.config)
+        self.lid_open = open_position
 
         if open_position:
             # Position lid above body with gap
@@ -87,35 +104,89 @@ class EnclosureAssembly:
         return self.add_body().add_lid(open_position=open_lid)
 
     def get_combined(self) -> cq.Workplane:
-        """Combine all components into single geometry."""
+        """Combine all components into single geometry.
+
+        An open lid is clear of the body, so the parts are returned as a
+        compound without a boolean union. A closed lid sits into the body
+        walls and still needs a real union.
+        """
         if not self.components:
             raise ValueError("No components in assembly")
 
-        combined = self.components[0].positioned
-        for comp in self.components[1:]:
+        if self.lid_open:
+            return self.get_compound()
+
+        components = iter(self.components)
+        combined = next(components).positioned
+        for comp in components:
             combined = combined.union(comp.positioned)
         return combined
 
-    def export(self, output_dir: Path, quality: STLQuality = STLQuality.NORMAL):
+    def get_compound(self) -> cq.Workplane:
+        """Collect all positioned components into one unfused compound.
+
+        Each part keeps its own solid. With the lid open this is exactly
+        what get_combined() returns. With the lid closed, the lid's lip
+        overlaps the body walls: get_combined() fuses them into one solid,
+        while the compound keeps both solids, overlap included. Parts are
+        placed with moved() rather than copied, so the compound shares their
+        faces and reuses any mesh already computed on them.
+        """
+        if not self.components:
+            raise ValueError("No components in assembly")
+
+        compound = cq.Compound.makeCompound([c.positioned.val() for c in self.components])
+        return cq.Workplane("XY").newObject([compound])
+
+    def get_assembly(self) -> cq.Assembly:
+        """Build a cq.Assembly with each component placed by location.
+
+        STEP export of the assembly keeps parts, names and colors separate
+        and needs no boolean operations.
+        """
+        if not self.components:
+            raise ValueError("No components in assembly")
+
+        assy = cq.Assembly(name="enclosure")
+        for comp in self.components:
+            assy.add(
+                comp.model,
+                name=comp.name,
+                loc=cq.Location(cq.Vector(*comp.position)),
+                color=cq.Color(comp.color),
+            )
+        return assy
+
+    def export(
+        self,
+        output_dir: Path,
+        quality: STLQuality = STLQuality.NORMAL,
+        parts: bool = True,
+    ):
         """Export assembly and individual parts to files.
 
         Args:
             output_dir: Directory to write files
             quality: STL mesh quality
+            parts: Also write body/lid files (skip if already exported)
         """
         output_dir.mkdir(exist_ok=True)
 
-        # Export combined assembly
-        combined = self.get_combined()
-        export_step(combined, output_dir / "assembly.step")
-        export_stl(combined, output_dir / "assembly.stl", quality=quality)
+        # Mesh each part once; every STL export below reuses it
+        for part in (self.body, self.lid):
+            if part:
+                mesh_model(part, quality=quality)
+
+        # Export combined assembly (no boolean union needed for either format)
+        export_step_assembly(self.get_assembly(), output_dir / "assembly.step")
+        export_stl(self.get_compound(), output_dir / "assembly.stl", quality=quality)
 
         # Export individual parts
-        if self.body:
+        if parts and self.body:
             export_step(self.body, output_dir / "body.step")
             export_stl(self.body, output_dir / "body.stl", quality=quality)
 
-        if self.lid:
+        if parts and self.lid:
             export_step(self.lid, output_dir / "lid.step")
             export_stl(self.lid, output_dir / "lid.stl", quality=quality)
 
@@ -129,11 +200,10 @@ def create_assembly(config: EnclosureConfig = CONFIG) -> EnclosureAssembly:
 
 # === Main / cq-editor ===
 
-# Create assembly for visualization
-_assembly = create_assembly()
-
-# For cq-editor: show components
-try:
+# For cq-editor: show components.
+# Guarded so importing this module (e.g. from build.py) builds nothing.
+if "show_object" in globals():
+    _assembly = create_assembly()
     for comp in _assembly.components:
         alpha = 0.8 if comp.name == "lid" else 1.0
         show_object(
@@ -141,8 +211,6 @@ try:
             name=comp.name,
             options={"color": comp.color, "alpha": alpha}
         )
-except NameError:
-    pass  # Not running in cq-editor
 
 # CLI execution
 if __name__ == "__main__":
@@ -155,7 +223,7 @@ if __name__ == "__main__":
     print(f"Lid style: {CONFIG.lid_style}")
     print()
 
-    _assembly.export(output_dir)
+    create_assembly().export(output_dir)
 
     print("\nTo visualize:")
     print(f"  cq-editor {__file__}")
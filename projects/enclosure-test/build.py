@@ -17,24 +17,34 @@ Usage:
     python build.py --export-all
 """
 
+from __future__ import annotations
+
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING
 import sys
 
 # Setup paths
 project_dir = Path(__file__).parent
-sys.path.insert(0, str(project_dir))
-sys.path.insert(0, str(project_dir.parent.parent))
+for _path in (project_dir, project_dir.parent.parent):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 from config import CONFIG, PRESETS, EnclosureConfig
-from frame import export_enclosure
-from assembly import create_assembly
-from semicad.export import STLQuality, BOM, BOMEntry, export_bom
+
+# frame, assembly and semicad.export pull in CadQuery; they are imported
+# where needed so --help and --list-variants stay fast.
+if TYPE_CHECKING:
+    from semicad.export import BOM, STLQuality
 
 
 def generate_bom(config: EnclosureConfig) -> BOM:
     """Generate bill of materials using semicad.export."""
+    from semicad.export import BOM, BOMEntry
+
     entries = [
         BOMEntry(
             name="Enclosure Body",
@@ -68,11 +78,14 @@ def generate_bom(config: EnclosureConfig) -> BOM:
         ))
 
     # Build notes with specifications
-    notes = f"""Specifications:
-- External: {config.width}x{config.height}x{config.depth}mm
-- Internal: {config.internal_width:.1f}x{config.internal_height:.1f}x{config.internal_depth:.1f}mm
-- Wall thickness: {config.wall_thickness}mm
-- Corner radius: {config.corner_radius}mm"""
+    notes_lines = [
+        "Specifications:",
+        f"- External: {config.width}x{config.height}x{config.depth}mm",
+        f"- Internal: {config.internal_width:.1f}x{config.internal_height:.1f}x{config.internal_depth:.1f}mm",
+        f"- Wall thickness: {config.wall_thickness}mm",
+        f"- Corner radius: {config.corner_radius}mm",
+    ]
+    notes = "\n".join(notes_lines)
 
     return BOM(
         title="enclosure-test",
@@ -85,33 +98,50 @@ def build_project(
     variant: str = "default",
     output_dir: Path | None = None,
     export_all: bool = False,
-    quality: STLQuality = STLQuality.NORMAL,
+    quality: STLQuality | None = None,
 ):
     """Build all project outputs."""
+    if quality is None:
+        from semicad.export import STLQuality
+        quality = STLQuality.NORMAL
     if output_dir is None:
         output_dir = project_dir / "output"
     output_dir.mkdir(exist_ok=True)
 
     if export_all:
-        for name, config in PRESETS.items():
-            print(f"\n{'='*50}")
-            print(f"Building variant: {name}")
-            print(f"{'='*50}")
-            variant_dir = output_dir / name
-            variant_dir.mkdir(exist_ok=True)
-            _build_variant(config, variant_dir, name, quality)
+        # Variants are independent and CPU-bound in OCCT, so build them in
+        # separate processes (output from workers may interleave).
+        workers = min(len(PRESETS), os.cpu_count() or 1)
+        jobs = [(name, config, output_dir, quality) for name, config in PRESETS.items()]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_build_preset, jobs))
     else:
         config = PRESETS.get(variant, CONFIG)
         _build_variant(config, output_dir, variant, quality)
 
 
+def _build_preset(job: tuple[str, EnclosureConfig, Path, STLQuality]):
+    """Build one preset into its own subdirectory (process pool entry point)."""
+    name, config, output_dir, quality = job
+    print(f"\n{'='*50}")
+    print(f"Building variant: {name}")
+    print(f"{'='*50}")
+    variant_dir = output_dir / name
+    variant_dir.mkdir(exist_ok=True)
+    _build_variant(config, variant_dir, name, quality)
+
+
 def _build_variant(
     config: EnclosureConfig,
     output_dir: Path,
     name: str,
-    quality: STLQuality = STLQuality.NORMAL,
+    quality: STLQuality,
 ):
     """Build a single variant."""
+    from frame import export_enclosure
+    from assembly import create_assembly
+    from semicad.export import export_bom
+
     print(f"\nConfiguration:")
     print(f"  External: {config.width} x {config.height} x {config.depth} mm")
     print(f"  Wall: {config.wall_thickness}mm")
@@ -122,10 +152,10 @@ def _build_variant(
     print("\nGenerating enclosure...")
     export_enclosure(output_dir, config, quality=quality)
 
-    # Generate assembly
+    # Generate assembly (body/lid files were written above)
     print("\nGenerating assembly...")
     assembly = create_assembly(config)
-    assembly.export(output_dir, quality=quality)
+    assembly.export(output_dir, quality=quality, parts=False)
 
     # Generate BOM using semicad.export (export all formats)
     print("\nGenerating BOM...")
@@ -187,6 +217,8 @@ def main():
             print(f"  {name:15} - {config.width}x{config.height}x{config.depth}mm, {config.lid_style} lid")
         return
 
+    from semicad.export import STLQuality
+
     quality = STLQuality(args.quality)
     build_project(
         variant=args.variant,
@@ -4,13 +4,17 @@ EnclosureTest Configuration
 Central configuration for the enclosure-test enclosure.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EnclosureConfig:
-    """Configuration parameters for the enclosure."""
+    """Configuration parameters for the enclosure.
+
+    Frozen so configs are hashable and can key the geometry caches in frame.py.
+    Slotted since fields are read many times per generated part.
+    """
 
     # External dimensions
     width: float = 100.0        # mm
@@ -42,25 +46,25 @@ class EnclosureConfig:
     screw_boss_diameter: float = 8.0  # mm
     screw_hole_diameter: float = 2.5  # mm (M3 tap)
 
-    @property
-    def internal_width(self) -> float:
-        """Internal cavity width."""
-        return self.width - 2 * self.wall_thickness
-
-    @property
-    def internal_height(self) -> float:
-        """Internal cavity height."""
-        return self.height - 2 * self.wall_thickness
-
-    @property
-    def internal_depth(self) -> float:
-        """Internal cavity depth (body only, not lid)."""
-        return self.depth - self.wall_thickness - self.lid_height
-
-    @property
-    def body_depth(self) -> float:
-        """Depth of the body (without lid)."""
-        return self.depth - self.lid_height
+    # Derived dimensions, computed once in __post_init__
+    internal_width: float = field(init=False, repr=False, compare=False)   # cavity width
+    internal_height: float = field(init=False, repr=False, compare=False)  # cavity height
+    internal_depth: float = field(init=False, repr=False, compare=False)   # cavity depth (body only)
+    body_depth: float = field(init=False, repr=False, compare=False)       # body without lid
+    # XY centers of the corner bosses, screw and mount holes
+    corner_positions: tuple[tuple[float, float], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        set_ = object.__setattr__
+        set_(self, "internal_width", self.width - 2 * self.wall_thickness)
+        set_(self, "internal_height", self.height - 2 * self.wall_thickness)
+        set_(self, "internal_depth", self.depth - self.wall_thickness - self.lid_height)
+        set_(self, "body_depth", self.depth - self.lid_height)
+
+        x = self.width / 2 - self.mount_inset
+        y = self.height / 2 - self.mount_inset
+        set_(self, "corner_positions", ((x, y), (-x, y), (x, -y), (-x, -y)))
 
 
 # Default configuration
@@ -17,28 +17,78 @@ Usage:
 """
 
 import cadquery as cq
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
+import hashlib
+import os
 import sys
+from typing import TYPE_CHECKING, Any
 
 # Setup paths for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(Path(__file__).parent))
+for _path in (project_root, Path(__file__).parent):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 from config import CONFIG, EnclosureConfig
 from semicad.export import export_step, export_stl, STLQuality
 
+if TYPE_CHECKING:
+    # show_object is only available in cq-editor runtime
+    def show_object(obj: Any, name: str = "", options: dict[str, Any] | None = None) -> None: ...
 
+
+# On-disk BREP cache so unchanged configs skip the boolean work across runs
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+def _shape_cache_path(config: EnclosureConfig, kind: str) -> Path:
+    """BREP cache path keyed by the config values and this file's source."""
+    key = hashlib.sha256()
+    key.update(Path(__file__).read_bytes())
+    key.update(repr(sorted(asdict(config).items())).encode())
+    return CACHE_DIR / f"enclosure-{key.hexdigest()[:16]}-{kind}.brep"
+
+
+def _load_or_build(config: EnclosureConfig, kind: str, build) -> cq.Workplane:
+    """Return cached geometry from disk, building and storing it on a miss."""
+    path = _shape_cache_path(config, kind)
+    if path.exists():
+        try:
+            return cq.Workplane("XY").newObject([cq.Shape.importBrep(str(path))])
+        except Exception:
+            pass  # Unreadable cache entry: rebuild and overwrite it
+
+    model = build(config)
+    path.parent.mkdir(exist_ok=True)
+    # Write then rename so parallel builds never read a partial file
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    model.val().exportBrep(str(tmp))
+    os.replace(tmp, path)
+    return model
+
+
+@lru_cache(maxsize=32)
 def generate_body(config: EnclosureConfig = CONFIG) -> cq.Workplane:
     """
     Generate the enclosure body (without lid).
 
+    Results are cached per config, in memory and as BREP under .cache/.
+    The returned Workplane is shared, so callers must derive new geometry
+    from it rather than mutate it.
+
     Args:
         config: EnclosureConfig with enclosure parameters
 
     Returns:
         CadQuery Workplane with body geometry
     """
+    return _load_or_build(config, "body", _build_body)
+
+
+def _build_body(config: EnclosureConfig) -> cq.Workplane:
+    """Build the body geometry (uncached)."""
     w = config.width
     h = config.height
     d = config.body_depth
@@ -76,46 +126,33 @@ def generate_body(config: EnclosureConfig = CONFIG) -> cq.Workplane:
     if config.screw_bosses:
         boss_r = config.screw_boss_diameter / 2
         hole_r = config.screw_hole_diameter / 2
-        inset = config.mount_inset
-
-        boss_positions = [
-            (w/2 - inset, h/2 - inset),
-            (-w/2 + inset, h/2 - inset),
-            (w/2 - inset, -h/2 + inset),
-            (-w/2 + inset, -h/2 + inset),
-        ]
-
-        for x, y in boss_positions:
-            # Add boss cylinder
-            boss = (
-                cq.Workplane("XY")
-                .center(x, y)
-                .circle(boss_r)
-                .extrude(d - t)
-                .translate((0, 0, -d/2 + t))
-            )
-            body = body.union(boss)
-
-            # Add screw hole
-            body = (
-                body
-                .faces(">Z")
-                .workplane()
-                .center(x, y)
-                .hole(hole_r * 2, d - t)
-            )
+
+        boss_positions = config.corner_positions
+
+        # Extrude all bosses up from the floor in one combined feature
+        body = (
+            body
+            .faces("<Z")
+            .workplane(invert=True, offset=t)
+            .pushPoints(boss_positions)
+            .circle(boss_r)
+            .extrude(d - t)
+        )
+
+        # Drill all screw holes in one cut
+        body = (
+            body
+            .faces(">Z")
+            .workplane()
+            .pushPoints(boss_positions)
+            .hole(hole_r * 2, d - t)
+        )
 
     # Add mounting holes on bottom
     if config.mount_holes:
-        inset = config.mount_inset
         hole_d = config.mount_hole_diameter
 
-        mount_positions = [
-            (w/2 - inset, h/2 - inset),
-            (-w/2 + inset, h/2 - inset),
-            (w/2 - inset, -h/2 + inset),
-            (-w/2 + inset, -h/2 + inset),
-        ]
+        mount_positions = config.corner_positions
 
         body = (
             body
@@ -128,16 +165,24 @@ def generate_body(config: EnclosureConfig = CONFIG) -> cq.Workplane:
     return body
 
 
+@lru_cache(maxsize=32)
 def generate_lid(config: EnclosureConfig = CONFIG) -> cq.Workplane:
     """
     Generate the enclosure lid.
 
+    Results are cached per config (see generate_body).
+
     Args:
         config: EnclosureConfig with enclosure parameters
 
     Returns:
         CadQuery Workplane with lid geometry
     """
+    return _load_or_build(config, "lid", _build_lid)
+
+
+def _build_lid(config: EnclosureConfig) -> cq.Workplane:
+    """Build the lid geometry (uncached)."""
     w = config.width
     h = config.height
     d = config.lid_height
@@ -159,24 +204,19 @@ def generate_lid(config: EnclosureConfig = CONFIG) -> cq.Workplane:
     lip_height = h - 2*t - 2*lip - clearance
     lip_depth = lip - clearance
 
-    inner_lip = (
-        cq.Workplane("XY")
-        .box(lip_width, lip_height, lip_depth)
-        .translate((0, 0, -d/2 - lip_depth/2))
+    lid = (
+        lid
+        .faces("<Z")
+        .workplane()
+        .rect(lip_width, lip_height)
+        .extrude(lip_depth)
     )
-    lid = lid.union(inner_lip)
 
     # Add screw holes if screw style
     if config.lid_style == "screw" and config.screw_bosses:
         hole_r = config.screw_hole_diameter / 2 + 0.5  # Clearance hole
-        inset = config.mount_inset
 
-        hole_positions = [
-            (w/2 - inset, h/2 - inset),
-            (-w/2 + inset, h/2 - inset),
-            (w/2 - inset, -h/2 + inset),
-            (-w/2 + inset, -h/2 + inset),
-        ]
+        hole_positions = config.corner_positions
 
         lid = (
             lid
@@ -189,6 +229,7 @@ def generate_lid(config: EnclosureConfig = CONFIG) -> cq.Workplane:
     return lid
 
 
+@lru_cache(maxsize=32)
 def generate_enclosure(config: EnclosureConfig = CONFIG) -> tuple[cq.Workplane, cq.Workplane]:
     """Generate both body and lid."""
     return generate_body(config), generate_lid(config)
@@ -225,19 +266,17 @@ def export_enclosure(
 
 # === Main / cq-editor ===
 
-# Generate parts for visualization
-_body = generate_body(CONFIG)
-_lid = generate_lid(CONFIG)
+# For cq-editor: show_object is only available in cq-editor context.
+# Guarded so importing this module (e.g. from build.py) generates nothing.
+if "show_object" in globals():
+    _body = generate_body(CONFIG)
+    _lid = generate_lid(CONFIG)
 
-# Position lid above body for visualization
-_lid_positioned = _lid.translate((0, 0, CONFIG.body_depth/2 + CONFIG.lid_height/2 + 5))
+    # Position lid above body for visualization
+    _lid_positioned = _lid.translate((0, 0, CONFIG.body_depth/2 + CONFIG.lid_height/2 + 5))
 
-# For cq-editor: show_object is only available in cq-editor context
-try:
     show_object(_body, name="Body", options={"color": "steelblue"})
     show_object(_lid_positioned, name="Lid", options={"color": "lightblue", "alpha": 0.8})
-except NameError:
-    pass  # Not running in cq-editor
 
 # CLI execution
 if __name__ == "__main__":
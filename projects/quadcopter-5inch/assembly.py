@@ -11,35 +11,56 @@ Usage:
 """
 
 import cadquery as cq
-import math
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Add paths for imports
 import sys
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "scripts"))
-sys.path.insert(0, str(Path(__file__).parent))
+for _path in (project_root, project_root / "scripts", Path(__file__).parent):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
 from config import CONFIG, QuadConfig
 from frame import generate_frame
 from components import get_component
-from semicad.export import export_step, export_stl, STLQuality
+from semicad.export import export_step, export_step_assembly, export_stl, mesh_model, STLQuality
 
+# Display colors that cq.Color does not know by name (RGB, 0-1)
+_RGB_COLORS = {
+    "dimgray": (0.41, 0.41, 0.41),
+    "silver": (0.75, 0.75, 0.75),
+}
 
-@dataclass
+
+def _to_color(name: str) -> cq.Color:
+    """Convert a display color name to a cq.Color."""
+    if name in _RGB_COLORS:
+        return cq.Color(*_RGB_COLORS[name])
+    return cq.Color(name)
+
+
+@dataclass(frozen=True, slots=True)
 class PositionedComponent:
     """A component with its position in the assembly."""
     name: str
     model: cq.Workplane
     position: tuple[float, float, float]
     color: str = "gray"
+    _positioned: cq.Workplane | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def positioned(self) -> cq.Workplane:
-        """Return the model translated to its position."""
-        return self.model.translate(self.position)
+        """Return the model placed at its position (computed once).
+
+        Placed with moved(), so the result shares geometry with the model
+        instead of copying it the way translate() does.
+        """
+        if self._positioned is None:
+            loc = cq.Location(cq.Vector(*self.position))
+            placed = cq.Workplane("XY").newObject([v.moved(loc) for v in self.model.vals()])
+            object.__setattr__(self, "_positioned", placed)
+        return self._positioned
 
 
 class QuadcopterAssembly:
@@ -158,15 +179,45 @@ class QuadcopterAssembly:
             .add_battery()
         )
 
-    def get_combined(self) -> cq.Workplane:
-        """Combine all components into single geometry."""
+    def get_combined(self, boolean: bool = False) -> cq.Workplane:
+        """Combine all components into single geometry.
+
+        Args:
+            boolean: Fuse components into one solid. By default they are
+                collected into a compound, which is all STL export and
+                display need and runs no boolean operation.
+        """
+        if not self.components:
+            raise ValueError("No components in assembly")
+
+        if not boolean:
+            compound = cq.Compound.makeCompound([c.positioned.val() for c in self.components])
+            return cq.Workplane("XY").newObject([compound])
+
+        # One n-ary fuse rather than a chain of pairwise unions
+        first, *rest = [c.positioned for c in self.components]
+        if not rest:
+            return first
+        return first.union(cq.Workplane("XY").add([r.val() for r in rest]))
+
+    def get_assembly(self) -> cq.Assembly:
+        """Build a cq.Assembly with each component placed by location.
+
+        STEP export of the assembly keeps parts, names and colors separate
+        and needs no boolean operations.
+        """
         if not self.components:
             raise ValueError("No components in assembly")
 
-        combined = self.components[0].positioned
-        for comp in self.components[1:]:
-            combined = combined.union(comp.positioned)
-        return combined
+        assy = cq.Assembly(name="quadcopter")
+        for comp in self.components:
+            assy.add(
+                comp.model,
+                name=comp.name,
+                loc=cq.Location(cq.Vector(*comp.position)),
+                color=_to_color(comp.color),
+            )
+        return assy
 
     def check_clearances(self) -> dict:
         """Check critical clearances."""
@@ -183,36 +234,51 @@ class QuadcopterAssembly:
 
         return results
 
-    def export(self, output_dir: Path, quality: STLQuality = STLQuality.NORMAL):
+    def export(
+        self,
+        output_dir: Path,
+        quality: STLQuality = STLQuality.NORMAL,
+        parts: bool = True,
+    ):
         """Export assembly to files.
 
         Args:
             output_dir: Directory to write files
             quality: STL mesh quality
+            parts: Also write frame files (skip if already exported)
         """
         output_dir.mkdir(exist_ok=True)
 
-        # Export combined assembly
-        combined = self.get_combined()
-        export_step(combined, output_dir / "assembly.step")
-        export_stl(combined, output_dir / "assembly.stl", quality=quality)
+        # Mesh each distinct model once; the compound below shares their
+        # faces, so the assembly STL and frame STL reuse these meshes
+        for model in {id(c.model): c.model for c in self.components}.values():
+            mesh_model(model, quality=quality)
+
+        # Export combined assembly (no boolean union needed for either format)
+        export_step_assembly(self.get_assembly(), output_dir / "assembly.step")
+        export_stl(self.get_combined(), output_dir / "assembly.stl", quality=quality)
 
         # Export frame only
-        if self.frame:
+        if parts and self.frame:
             export_step(self.frame, output_dir / "frame.step")
             export_stl(self.frame, output_dir / "frame.stl", quality=quality)
 
         print(f"Exported to {output_dir} (quality: {quality.value})")
 
     def show_in_editor(self):
-        """Display in cq-editor (call from script)."""
+        """Display in cq-editor as a single assembly (call from script).
+
+        One show_object() call hands the viewer every part with its color
+        and location, instead of one object per component.
+        """
+        assy = self.get_assembly()
+        # Props are drawn translucent so the motors stay visible
         for comp in self.components:
-            alpha = 0.3 if "prop" in comp.name else 1.0
-            show_object(
-                comp.positioned,
-                name=comp.name,
-                options={"color": comp.color, "alpha": alpha}
-            )
+            if "prop" in comp.name:
+                part = assy.objects[comp.name]
+                r, g, b, _ = part.color.toTuple()
+                part.color = cq.Color(r, g, b, 0.3)
+        show_object(assy, name="quadcopter")
 
 
 def create_assembly(config: QuadConfig = CONFIG) -> QuadcopterAssembly:
@@ -222,24 +288,15 @@ def create_assembly(config: QuadConfig = CONFIG) -> QuadcopterAssembly:
 
 # === Main / cq-editor ===
 
-# Create assembly for visualization
-_assembly = create_assembly()
-
-# For cq-editor: show components
-try:
-    for comp in _assembly.components:
-        alpha = 0.3 if "prop" in comp.name else 1.0
-        show_object(
-            comp.positioned,
-            name=comp.name,
-            options={"color": comp.color, "alpha": alpha}
-        )
-except NameError:
-    pass  # Not running in cq-editor
+# For cq-editor: show components.
+# Guarded so importing this module (e.g. from build.py) builds nothing.
+if "show_object" in globals():
+    create_assembly().show_in_editor()
 
 # CLI execution
 if __name__ == "__main__":
     output_dir = Path(__file__).parent / "output"
+    _assembly = create_assembly()
 
     print("Building Quadcopter 5-inch Assembly")
     print("=" * 40)
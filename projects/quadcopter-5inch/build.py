@@ -16,9 +16,14 @@ Usage:
     python build.py --export-all
 """
 
+from __future__ import annotations
+
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING
 import sys
 
 # Setup paths
@@ -28,13 +33,45 @@ sys.path.insert(0, str(project_dir.parent.parent))
 sys.path.insert(0, str(project_dir.parent.parent / "scripts"))
 
 from config import CONFIG, PRESETS, QuadConfig
-from frame import generate_frame, export_frame
-from assembly import create_assembly
-from semicad.export import STLQuality, BOM, BOMEntry, export_bom
+
+# frame, assembly and semicad.export pull in CadQuery; they are imported
+# where needed so --help and --list-variants stay fast.
+if TYPE_CHECKING:
+    from semicad.export import BOM, STLQuality
+
+
+# Stack and motor hardware is the same for every variant (BOMEntry fields)
+HARDWARE_ENTRIES: tuple[dict[str, str | int], ...] = (
+    {
+        "name": "M3x25 Socket Head Screw",
+        "quantity": 4,
+        "category": "Hardware",
+        "description": "Stack mounting",
+    },
+    {
+        "name": "M3 Nut",
+        "quantity": 4,
+        "category": "Hardware",
+    },
+    {
+        "name": "M3x8 Button Head Screw",
+        "quantity": 16,
+        "category": "Hardware",
+        "description": "Motor mounting",
+    },
+    {
+        "name": "M3 Standoff 20mm",
+        "quantity": 4,
+        "category": "Hardware",
+        "description": "Stack spacing",
+    },
+)
 
 
 def generate_bom(config: QuadConfig) -> BOM:
     """Generate bill of materials using semicad.export."""
+    from semicad.export import BOM, BOMEntry
+
     entries = [
         # Frame
         BOMEntry(
@@ -75,38 +112,19 @@ def generate_bom(config: QuadConfig) -> BOM:
             category="Power",
         ),
         # Hardware
-        BOMEntry(
-            name="M3x25 Socket Head Screw",
-            quantity=4,
-            category="Hardware",
-            description="Stack mounting",
-        ),
-        BOMEntry(
-            name="M3 Nut",
-            quantity=4,
-            category="Hardware",
-        ),
-        BOMEntry(
-            name="M3x8 Button Head Screw",
-            quantity=16,
-            category="Hardware",
-            description="Motor mounting",
-        ),
-        BOMEntry(
-            name="M3 Standoff 20mm",
-            quantity=4,
-            category="Hardware",
-            description="Stack spacing",
-        ),
+        *(BOMEntry(**hw) for hw in HARDWARE_ENTRIES),
     ]
 
     # Build notes with specifications
-    notes = f"""Specifications:
-- Wheelbase: {config.wheelbase}mm
-- Arm length: {config.arm_length:.1f}mm
-- Prop clearance: {config.check_prop_clearance()[1]:.1f}mm
-- Frame weight (est): ~35g
-- AUW (est): ~350g"""
+    notes_lines = [
+        "Specifications:",
+        f"- Wheelbase: {config.wheelbase}mm",
+        f"- Arm length: {config.arm_length:.1f}mm",
+        f"- Prop clearance: {config.check_prop_clearance()[1]:.1f}mm",
+        "- Frame weight (est): ~35g",
+        "- AUW (est): ~350g",
+    ]
+    notes = "\n".join(notes_lines)
 
     return BOM(
         title=f"Quadcopter 5-inch ({config.wheelbase}mm)",
@@ -119,7 +137,7 @@ def build_project(
     variant: str = "freestyle",
     output_dir: Path | None = None,
     export_all: bool = False,
-    quality: STLQuality = STLQuality.NORMAL,
+    quality: STLQuality | None = None,
 ):
     """
     Build all project outputs.
@@ -128,34 +146,50 @@ def build_project(
         variant: Configuration preset name
         output_dir: Output directory (default: project/output)
         export_all: Export all variants
-        quality: STL mesh quality
+        quality: STL mesh quality (default: normal)
     """
+    if quality is None:
+        from semicad.export import STLQuality
+        quality = STLQuality.NORMAL
     if output_dir is None:
         output_dir = project_dir / "output"
     output_dir.mkdir(exist_ok=True)
 
     if export_all:
-        # Build all variants
-        for name, config in PRESETS.items():
-            print(f"\n{'='*50}")
-            print(f"Building variant: {name}")
-            print(f"{'='*50}")
-            variant_dir = output_dir / name
-            variant_dir.mkdir(exist_ok=True)
-            _build_variant(config, variant_dir, name, quality)
+        # Variants are independent and CPU-bound in OCCT, so build them in
+        # separate processes (output from workers may interleave).
+        workers = min(len(PRESETS), os.cpu_count() or 1)
+        jobs = [(name, config, output_dir, quality) for name, config in PRESETS.items()]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_build_preset, jobs))
     else:
         # Build single variant
         config = PRESETS.get(variant, CONFIG)
         _build_variant(config, output_dir, variant, quality)
 
 
+def _build_preset(job: tuple[str, QuadConfig, Path, STLQuality]):
+    """Build one preset into its own subdirectory (process pool entry point)."""
+    name, config, output_dir, quality = job
+    print(f"\n{'='*50}")
+    print(f"Building variant: {name}")
+    print(f"{'='*50}")
+    variant_dir = output_dir / name
+    variant_dir.mkdir(exist_ok=True)
+    _build_variant(config, variant_dir, name, quality)
+
+
 def _build_variant(
     config: QuadConfig,
     output_dir: Path,
     name: str,
-    quality: STLQuality = STLQuality.NORMAL,
+    quality: STLQuality,
 ):
     """Build a single variant."""
+    from frame import export_frame
+    from assembly import create_assembly
+    from semicad.export import export_bom
+
     print(f"\nConfiguration:")
     print(f"  Wheelbase: {config.wheelbase}mm")
     print(f"  Props: {config.prop_size} inch")
@@ -171,10 +205,10 @@ def _build_variant(
     print("\nGenerating frame...")
     frame = export_frame(output_dir, config, quality=quality)
 
-    # Generate assembly
+    # Generate assembly (frame files were written above)
     print("\nGenerating assembly...")
     assembly = create_assembly(config)
-    assembly.export(output_dir, quality=quality)
+    assembly.export(output_dir, quality=quality, parts=False)
 
     # Generate BOM using semicad.export (export all formats)
     print("\nGenerating BOM...")
@@ -236,6 +270,8 @@ def main():
             print(f"  {name:15} - {config.wheelbase}mm, {config.prop_size}\" props, {config.motor_size} motors")
         return
 
+    from semicad.export import STLQuality
+
     quality = STLQuality(args.quality)
     build_project(
         variant=args.variant,
@@ -4,14 +4,28 @@ Quadcopter 5-inch Configuration
 Central configuration for the 220mm freestyle quad build.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 import math
 
+# cos(45 deg) = sin(45 deg), exactly sqrt(2)/2
+_SQRT2_2 = math.sqrt(2) / 2
 
-@dataclass
+# Unit XY directions of the four arms (X-frame: 45, 135, 225, 315 deg)
+MOTOR_DIRECTIONS: tuple[tuple[float, float], ...] = (
+    (_SQRT2_2, _SQRT2_2),
+    (-_SQRT2_2, _SQRT2_2),
+    (-_SQRT2_2, -_SQRT2_2),
+    (_SQRT2_2, -_SQRT2_2),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class QuadConfig:
-    """Configuration parameters for the quadcopter."""
+    """Configuration parameters for the quadcopter.
+
+    Frozen so derived values computed in __post_init__ cannot go stale.
+    """
 
     # Frame geometry
     wheelbase: float = 220.0        # mm, motor-to-motor diagonal
@@ -37,33 +51,29 @@ class QuadConfig:
     prop_clearance: float = 5.0     # mm, minimum between prop tips
     battery_clearance: float = 2.0  # mm, battery to frame
 
-    @property
-    def arm_length(self) -> float:
-        """Distance from center to motor mount."""
-        return self.wheelbase / 2 * math.cos(math.radians(45))
-
-    @property
-    def prop_radius(self) -> float:
-        """Propeller radius in mm."""
-        return self.prop_size * 25.4 / 2
-
-    @property
-    def motor_positions(self) -> list[tuple[float, float]]:
-        """XY positions of all 4 motors."""
-        return [
-            (
-                self.arm_length * math.cos(math.radians(45 + i * 90)),
-                self.arm_length * math.sin(math.radians(45 + i * 90)),
-            )
-            for i in range(4)
-        ]
+    # Derived values, computed once in __post_init__
+    arm_length: float = field(init=False, repr=False, compare=False)   # center to motor mount
+    prop_radius: float = field(init=False, repr=False, compare=False)  # mm
+    # XY positions of all 4 motors
+    motor_positions: tuple[tuple[float, float], ...] = field(init=False, repr=False, compare=False)
+    # Gap between adjacent prop tips
+    _prop_tip_clearance: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        set_ = object.__setattr__
+        arm = self.wheelbase / 2 * _SQRT2_2
+        set_(self, "arm_length", arm)
+        set_(self, "prop_radius", self.prop_size * 25.4 / 2)
+        set_(self, "motor_positions", tuple((arm * dx, arm * dy) for dx, dy in MOTOR_DIRECTIONS))
 
-    def check_prop_clearance(self) -> tuple[bool, float]:
-        """Check if props have adequate clearance."""
         # Distance between adjacent motor centers
         motor_distance = self.wheelbase / math.sqrt(2)
-        # Clearance = distance - 2 * prop_radius
-        clearance = motor_distance - 2 * self.prop_radius
+        set_(self, "_prop_tip_clearance", motor_distance - 2 * self.prop_radius)
+
+    def check_prop_clearance(self) -> tuple[bool, float]:
+        """Check if props have adequate clearance."""
+        clearance = self._prop_tip_clearance
         return clearance >= self.prop_clearance, clearance
 
 
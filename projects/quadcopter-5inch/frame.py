@@ -17,98 +17,127 @@ Usage:
 """
 
 import cadquery as cq
-import math
+from functools import lru_cache
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING, Any
 
 # Setup paths for imports
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(Path(__file__).parent))
+for _path in (project_root, Path(__file__).parent):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
 
-from config import CONFIG, QuadConfig
+from config import CONFIG, MOTOR_DIRECTIONS, QuadConfig
 from semicad.export import export_step, export_stl, STLQuality
 
+if TYPE_CHECKING:
+    # show_object is only available in cq-editor runtime
+    def show_object(obj: Any, name: str = "", options: dict[str, Any] | None = None) -> None: ...
+
+
+# QuadConfig fields the frame geometry depends on
+FRAME_FIELDS = ("wheelbase", "arm_width", "arm_thickness", "center_size", "fc_mount", "motor_mount")
+
 
 def generate_frame(config: QuadConfig = CONFIG) -> cq.Workplane:
     """
     Generate the quadcopter frame geometry.
 
+    Results are cached on the frame fields only, so configs that differ
+    just in motors, battery or props share one frame. The returned
+    Workplane is shared, so callers must derive new geometry from it
+    rather than mutate it.
+
     Args:
         config: QuadConfig with frame parameters
 
     Returns:
         CadQuery Workplane with frame geometry
     """
+    frame_config = QuadConfig(**{f: getattr(config, f) for f in FRAME_FIELDS})
+    return _generate_frame(frame_config)
+
+
+def _disc(x: float, y: float, diameter: float) -> cq.Face:
+    """Circular face in the XY plane."""
+    circle = cq.Wire.makeCircle(diameter / 2, cq.Vector(x, y, 0), cq.Vector(0, 0, 1))
+    return cq.Face.makeFromWires(circle)
+
+
+def _drill(face: cq.Face, holes: list[tuple[float, float, float]]) -> cq.Shape:
+    """Cut holes, given as (x, y, diameter), from a face in one boolean."""
+    return face.cut(*[_disc(x, y, d) for x, y, d in holes])
+
+
+@lru_cache(maxsize=32)
+def _generate_frame(config: QuadConfig) -> cq.Workplane:
+    """Build the frame geometry (cached per frame-relevant config).
+
+    The frame is a flat plate, so its outline is assembled from 2D faces
+    and extruded once. Face booleans are much cheaper than solid ones,
+    and the result is the same solid the 3D union of plates gave.
+    """
     arm_length = config.arm_length
     t = config.arm_thickness
 
     # === Center Plate ===
-    center = (
-        cq.Workplane("XY")
-        .box(config.center_size, config.center_size, t)
-        .edges("|Z")
-        .fillet(4)
+    m = config.fc_mount / 2
+    center = cq.Sketch().rect(config.center_size, config.center_size).vertices().fillet(4)
+    center = _drill(center._faces, [
         # FC/ESC mount holes (M3)
-        .faces(">Z")
-        .workplane()
-        .rect(config.fc_mount, config.fc_mount, forConstruction=True)
-        .vertices()
-        .hole(3.2)
+        (m, m, 3.2), (-m, m, 3.2), (-m, -m, 3.2), (m, -m, 3.2),
         # Center weight-reduction hole
-        .faces(">Z")
-        .workplane()
-        .hole(12)
-    )
-
-    frame = center
+        (0, 0, 12),
+    ])
 
     # === Arms ===
-    for i in range(4):
+    # All arms (and all motor pads) are identical, so each is built and
+    # filleted/drilled once, then placed around the frame.
+    arm_start = config.center_size / 2 * 0.707  # Distance to corner
+    arm_actual_length = arm_length - arm_start - 8  # Leave room for motor mount
+
+    arm_base = (
+        cq.Sketch()
+        # Position: start at center edge, extend outward along +X
+        .push([(arm_actual_length / 2 + arm_start + 4, 0)])
+        .rect(arm_actual_length, config.arm_width)
+        .reset()
+        .vertices()
+        .fillet(2)
+    )._faces
+
+    # Motor mount pad (circular), centered on the origin
+    motor_pad_radius = config.motor_mount / 2 + 6
+    bolt_r = config.motor_mount / 2  # Bolts at 0/90/180/270 deg
+    pad_base = _drill(_disc(0, 0, 2 * motor_pad_radius), [
+        # Motor bolt holes (M3)
+        (bolt_r, 0, 3.2), (0, bolt_r, 3.2), (-bolt_r, 0, 3.2), (0, -bolt_r, 3.2),
+        # Center shaft hole
+        (0, 0, 10),
+    ])
+
+    # Arms go on after the center and pads are drilled, so they cover
+    # the inner edge of each pad's bolt holes. Tools stay in angular
+    # order with each arm next to its own pad.
+    parts: list[cq.Shape] = []
+    for i, (dx, dy) in enumerate(MOTOR_DIRECTIONS):
         angle = 45 + i * 90  # X-frame layout
 
         # Motor position
-        mx = arm_length * math.cos(math.radians(angle))
-        my = arm_length * math.sin(math.radians(angle))
-
-        # Arm extends from center edge to motor
-        arm_start = config.center_size / 2 * 0.707  # Distance to corner
-        arm_actual_length = arm_length - arm_start - 8  # Leave room for motor mount
-
-        # Create arm
-        arm = (
-            cq.Workplane("XY")
-            .box(arm_actual_length, config.arm_width, t)
-            .edges("|Z")
-            .fillet(2)
-            # Position: start at center edge, extend outward
-            .translate((arm_actual_length / 2 + arm_start + 4, 0, 0))
-            .rotate((0, 0, 0), (0, 0, 1), angle)
-        )
-
-        # Motor mount pad (circular)
-        motor_pad_radius = config.motor_mount / 2 + 6
-        motor_mount = (
-            cq.Workplane("XY")
-            .cylinder(t, motor_pad_radius)
-            .translate((mx, my, 0))
-            # Motor bolt holes (M3)
-            .faces(">Z")
-            .workplane()
-            .pushPoints([
-                (mx + config.motor_mount/2 * math.cos(math.radians(a)),
-                 my + config.motor_mount/2 * math.sin(math.radians(a)))
-                for a in [0, 90, 180, 270]
-            ])
-            .hole(3.2)
-            # Center shaft hole
-            .faces(">Z")
-            .workplane()
-            .center(mx, my)
-            .hole(10)
-        )
-
-        frame = frame.union(arm).union(motor_mount)
+        mx = arm_length * dx
+        my = arm_length * dy
+
+        arm = arm_base.rotate(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), angle)
+        motor_mount = pad_base.translate(cq.Vector(mx, my, 0))
+
+        parts.extend([arm, motor_mount])
+
+    outline = center.fuse(*parts).clean()
+
+    # One extrusion, centered on Z=0 like the plates it replaces
+    plate = cq.Solid.extrudeLinear(outline.Faces()[0], cq.Vector(0, 0, t))
+    frame = cq.Workplane("XY").newObject([plate.translate(cq.Vector(0, 0, -t / 2))])
 
     # === Weight Reduction ===
     # Add lightening holes in arms (optional)
@@ -159,14 +188,11 @@ def export_frame(
 
 # === Main / cq-editor ===
 
-# Generate frame for visualization
-_frame = generate_frame(CONFIG)
-
-# For cq-editor: show_object is only available in cq-editor context
-try:
+# For cq-editor: show_object is only available in cq-editor context.
+# Guarded so importing this module (e.g. from build.py) generates nothing.
+if "show_object" in globals():
+    _frame = generate_frame(CONFIG)
     show_object(_frame, name="Frame", options={"color": "gold"})
-except NameError:
-    pass  # Not running in cq-editor
 
 # CLI execution
 if __name__ == "__main__":
@@ -13,12 +13,14 @@ Usage:
 """
 
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import cadquery as cq
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
     # show_object is only available in cq-editor runtime
     def show_object(obj: Any, name: str = "") -> None: ...
@@ -167,8 +169,8 @@ def motor(
         .cylinder(shaft_length, shaft_diameter / 2)
     )
 
-    # Combine
-    motor_assy = base.union(stator).union(bell).union(shaft)
+    # Combine in one n-ary fuse rather than a chain of pairwise unions
+    motor_assy = base.union(cq.Workplane("XY").add([stator.val(), bell.val(), shaft.val()]))
 
     return motor_assy
 
@@ -224,13 +226,12 @@ def propeller(
     """
     diameter_mm = diameter * 25.4  # Convert to mm
 
-    prop = (
-        cq.Workplane("XY")
-        .cylinder(1, diameter_mm / 2)  # 1mm thick disc
-        .faces(">Z")
-        .workplane()
-        .hole(hub_diameter)  # Center hole
-    )
+    # 1mm thick disc centered on Z=0 with a center hole. Two coaxial
+    # solids and one cut; no workplane face selection needed.
+    base = cq.Vector(0, 0, -0.5)
+    disc = cq.Solid.makeCylinder(diameter_mm / 2, 1, base)
+    hub = cq.Solid.makeCylinder(hub_diameter / 2, 1, base)
+    prop = cq.Workplane("XY").newObject([disc.cut(hub)])
 
     return prop
 
@@ -267,8 +268,13 @@ COMPONENTS = {
 }
 
 
+@cache
 def get_component(name: str) -> cq.Workplane:
-    """Get a component model by name."""
+    """Get a component model by name.
+
+    Models are built once per name and cached. The returned Workplane is
+    shared: place it with translate()/moved(), never modify it in place.
+    """
     if name not in COMPONENTS:
         raise ValueError(f"Unknown component: {name}. Available: {list(COMPONENTS.keys())}")
 
@@ -277,8 +283,19 @@ def get_component(name: str) -> cq.Workplane:
     return func(**comp["args"])
 
 
+def _export_component(job: tuple[str, "Path"]) -> str:
+    """Build one component and write its STEP and STL (process pool entry point)."""
+    name, output_dir = job
+    comp = get_component(name)
+    cq.exporters.export(comp, str(output_dir / f"{name}.step"))
+    cq.exporters.export(comp, str(output_dir / f"{name}.stl"))
+    return name
+
+
 # ============== TEST / VISUALIZATION ==============
 if __name__ == "__main__":
+    import os
+    from concurrent.futures import ProcessPoolExecutor
     from pathlib import Path
 
     output_dir = Path(__file__).parent.parent / "output" / "components"
@@ -286,12 +303,13 @@ if __name__ == "__main__":
 
     print("Generating component models...")
 
-    # Generate each component
-    for name in ["fc_f405_30x30", "esc_45a_30x30", "motor_2207", "battery_4s_1300", "prop_5inch"]:
-        print(f"  {name}...")
-        comp = get_component(name)
-        cq.exporters.export(comp, str(output_dir / f"{name}.step"))
-        cq.exporters.export(comp, str(output_dir / f"{name}.stl"))
+    # Components are independent, so build and export them in parallel.
+    # OCCT holds the GIL, hence processes rather than threads.
+    names = ["fc_f405_30x30", "esc_45a_30x30", "motor_2207", "battery_4s_1300", "prop_5inch"]
+    workers = min(len(names), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for name in executor.map(_export_component, [(name, output_dir) for name in names]):
+            print(f"  {name}")
 
     print(f"\nComponents saved to: {output_dir}")
 
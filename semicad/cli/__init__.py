@@ -7,9 +7,11 @@ Usage:
 """
 
 import platform
+import re
 import sys
-from importlib.metadata import PackageNotFoundError, version as get_pkg_version
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -46,6 +48,59 @@ def get_ctx_value(ctx: click.Context, key: str, default: object = None) -> objec
     return ctx.obj.get(key, default)
 
 
+# STLQuality values, spelled out so option parsing does not import CadQuery
+STL_QUALITIES = ("draft", "normal", "fine", "ultra")
+
+# KEY=VALUE literal classification for parse_params
+_INT_RE = re.compile(r"[-+]?\d+")
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_BOOL_VALUES = {"true": True, "yes": True, "false": False, "no": False}
+
+
+def parse_params(value: tuple[str, ...] | None) -> dict[str, Any]:
+    """Parse KEY=VALUE parameter pairs into a dictionary.
+
+    Values are converted to int, float or bool when they look like one
+    ("1"/"0" are ints), and are otherwise kept as strings.
+
+    Raises:
+        click.BadParameter: If an item has no "="
+    """
+    if not value:
+        return {}
+    params: dict[str, Any] = {}
+    for item in value:
+        if "=" not in item:
+            raise click.BadParameter(f"Invalid parameter format: {item}. Use KEY=VALUE")
+        key, val = item.split("=", 1)
+        params[key] = _parse_value(val)
+    return params
+
+
+def _parse_value(val: str) -> Any:
+    """Convert one value as int(), then float(), then a bool word would."""
+    # Fast path for the usual literals, without raising ValueError
+    if _INT_RE.fullmatch(val):
+        return int(val)
+    if _FLOAT_RE.fullmatch(val):
+        return float(val)
+    if val.lower() in _BOOL_VALUES:
+        return _BOOL_VALUES[val.lower()]
+    # Anything else int()/float() accept: " 5", "1_000", "inf", "nan"
+    try:
+        return int(val)
+    except ValueError:
+        pass
+    try:
+        return float(val)
+    except ValueError:
+        return val
+
+
+# Subcommands that never read ctx.obj["project"]; skip resolving one for them
+_PROJECT_FREE_COMMANDS = frozenset({"version", "completion", "lib", "l", "search", "partcad"})
+
+
 # Create main CLI group
 @click.group(invoke_without_command=True)
 @click.option("--project", "-p", type=click.Path(exists=True), help="Project root directory")
@@ -63,12 +118,13 @@ def cli(ctx: click.Context, project: str | None, json_output: bool, verbose: boo
         click.echo(ctx.get_help())
         return
 
-    # Set project context
+    # Set project context. An explicit --project is always loaded so a bad
+    # one is reported; the cwd default is skipped for project-free commands.
     if project:
         ctx.obj["project"] = get_project(project)
         if verbose:
             verbose_echo(ctx, f"Project root: {project}")
-    else:
+    elif ctx.invoked_subcommand not in _PROJECT_FREE_COMMANDS:
         ctx.obj["project"] = get_project(Path.cwd())
         if verbose:
             verbose_echo(ctx, f"Project root: {Path.cwd()}")
@@ -113,8 +169,11 @@ def l_alias(ctx: click.Context) -> None:
     ctx.invoke(library.list_libs)
 
 
+@cache
 def _get_version(package_name: str) -> str | None:
-    """Get version of a package, or None if not installed."""
+    """Get version of a package, or None if not installed (cached)."""
+    from importlib.metadata import PackageNotFoundError, version as get_pkg_version
+
     try:
         return get_pkg_version(package_name)
     except PackageNotFoundError:
@@ -2,12 +2,49 @@
 Build commands - Generate and export CAD files.
 """
 
+import os
+import sys
 from pathlib import Path
 from typing import Any
 
 import click
 
-from semicad.cli import verbose_echo
+from semicad.cli import STL_QUALITIES, parse_params, verbose_echo
+from semicad.core.project import Project
+
+
+def _run_script(script: Path, project: Project) -> int:
+    """Run a project script as __main__ in this interpreter.
+
+    Equivalent to `cd <root> && PYTHONPATH=<scripts>:<root> python <script>`
+    without starting a second interpreter and re-importing CadQuery.
+    sys.path, sys.argv and the working directory are restored afterwards.
+
+    Returns:
+        The script's exit code (1 if it raised)
+    """
+    import runpy
+    import traceback
+
+    saved_path, saved_argv, saved_cwd = sys.path[:], sys.argv[:], os.getcwd()
+    sys.path[:0] = [str(project.scripts_dir), str(project.root)]
+    sys.argv[:] = [str(script)]
+    os.chdir(project.root)
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        click.echo(e.code, err=True)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.path[:] = saved_path
+        sys.argv[:] = saved_argv
+        os.chdir(saved_cwd)
 
 
 @click.command()
@@ -26,31 +63,30 @@ def build(ctx: click.Context, output: str | None) -> None:
     verbose_echo(ctx, f"Looking for build script: {build_script}")
 
     if build_script.exists():
-        import os
-        import subprocess
-
-        env = os.environ.copy()
-        env["PYTHONPATH"] = f"{project.scripts_dir}:{project.root}"
-
-        verbose_echo(ctx, f"PYTHONPATH: {env['PYTHONPATH']}")
+        verbose_echo(ctx, f"sys.path += {project.scripts_dir}, {project.root}")
         verbose_echo(ctx, f"Working directory: {project.root}")
-        verbose_echo(ctx, f"Running: python {build_script}")
+        verbose_echo(ctx, f"Running in-process: {build_script}")
 
-        result = subprocess.run(
-            ["python", str(build_script)],
-            env=env,
-            cwd=str(project.root),
-            check=False,
-        )
+        returncode = _run_script(build_script, project)
 
-        verbose_echo(ctx, f"Build script exit code: {result.returncode}")
+        verbose_echo(ctx, f"Build script exit code: {returncode}")
 
-        if result.returncode == 0:
+        if returncode == 0:
             click.echo("\nBuild complete. Output files:")
-            for f in output_dir.glob("*.step"):
-                click.echo(f"  {f.name}")
-            for f in output_dir.glob("*.stl"):
-                click.echo(f"  {f.name}")
+            # One directory scan for both formats; STEP files listed first
+            step_names: list[str] = []
+            stl_names: list[str] = []
+            # --output may name a directory the script never created
+            if output_dir.is_dir():
+                with os.scandir(output_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".step") and entry.is_file():
+                            step_names.append(entry.name)
+                        elif entry.name.endswith(".stl") and entry.is_file():
+                            stl_names.append(entry.name)
+            if step_names or stl_names:
+                # One write for the whole listing rather than one per file
+                click.echo("\n".join(f"  {name}" for name in step_names + stl_names))
     else:
         click.echo("No build script found.", err=True)
 
@@ -107,31 +143,7 @@ def parse_param(
     ctx: click.Context, param: click.Parameter | None, value: tuple[str, ...]
 ) -> dict[str, Any]:
     """Parse KEY=VALUE parameter pairs into a dictionary."""
-    if not value:
-        return {}
-    params: dict[str, Any] = {}
-    for item in value:
-        if "=" not in item:
-            raise click.BadParameter(f"Invalid parameter format: {item}. Use KEY=VALUE")
-        key, val = item.split("=", 1)
-        # Try to convert to appropriate type
-        try:
-            # Try int first
-            params[key] = int(val)
-        except ValueError:
-            try:
-                # Then float
-                params[key] = float(val)
-            except ValueError:
-                # Handle booleans
-                if val.lower() in ("true", "yes", "1"):
-                    params[key] = True
-                elif val.lower() in ("false", "no", "0"):
-                    params[key] = False
-                else:
-                    # Keep as string
-                    params[key] = val
-    return params
+    return parse_params(value)
 
 
 @click.command()
@@ -147,7 +159,7 @@ def parse_param(
 @click.option(
     "--quality",
     "-q",
-    type=click.Choice(["draft", "normal", "fine", "ultra"]),
+    type=click.Choice(STL_QUALITIES),
     default="normal",
     help="STL mesh quality",
 )
@@ -197,14 +209,7 @@ def export(
     # Parse component parameters
     comp_params = parse_param(ctx, None, param)
 
-    # Map quality string to enum
-    quality_map = {
-        "draft": STLQuality.DRAFT,
-        "normal": STLQuality.NORMAL,
-        "fine": STLQuality.FINE,
-        "ultra": STLQuality.ULTRA,
-    }
-    stl_quality = quality_map[quality]
+    stl_quality = STLQuality(quality)
 
     verbose_echo(ctx, f"STL quality: {quality} -> {stl_quality}")
     if tolerance:
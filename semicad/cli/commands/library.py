@@ -3,11 +3,16 @@ Library commands - Browse and search component libraries.
 """
 
 import json
+from collections import defaultdict
+from itertools import islice
 from typing import Any
 
 import click
 
-from semicad.cli import get_ctx_value, verbose_echo
+from semicad.cli import get_ctx_value, parse_params, verbose_echo
+
+# Hits shown by `search` in text mode
+SEARCH_DISPLAY_LIMIT = 20
 
 
 @click.group()
@@ -37,19 +42,14 @@ def list_libs(ctx: click.Context, source: str | None, category: str | None) -> N
         if source and src_name != source:
             continue
 
-        components = list(registry.list_from(src_name))
-        if category:
-            components = [c for c in components if c.category == category]
-
-        # Group by category
-        by_category: dict[str, list[Any]] = {}
-        for comp in components:
-            by_category.setdefault(comp.category, []).append(comp)
+        # Filter and group by category in one pass over the source
+        by_category: defaultdict[str, list[str]] = defaultdict(list)
+        for comp in registry.list_from(src_name):
+            if category and comp.category != category:
+                continue
+            by_category[comp.category].append(comp.name)
 
-        data["sources"][src_name] = {
-            cat: [comp.name for comp in comps]
-            for cat, comps in sorted(by_category.items())
-        }
+        data["sources"][src_name] = dict(sorted(by_category.items()))
 
     if json_output:
         click.echo(json.dumps(data, indent=2))
@@ -369,67 +369,53 @@ def search(ctx: click.Context, query: str, source: str | None) -> None:
         verbose_echo(ctx, f"Filtering by source: {source}")
 
     verbose_echo(ctx, f"Executing search query: '{query}'")
-    results = list(registry.search(query, source))
-    verbose_echo(ctx, f"Search returned {len(results)} results")
-
-    data = {
-        "query": query,
-        "source_filter": source,
-        "total": len(results),
-        "results": [
-            {
-                "name": spec.name,
-                "source": spec.source,
-                "category": spec.category,
-                "description": spec.description,
-                "full_name": spec.full_name,
-            }
-            for spec in results
-        ],
-    }
 
     if json_output:
+        results = list(registry.search(query, source))
+        verbose_echo(ctx, f"Search returned {len(results)} results")
+        data = {
+            "query": query,
+            "source_filter": source,
+            "total": len(results),
+            "results": [
+                {
+                    "name": spec.name,
+                    "source": spec.source,
+                    "category": spec.category,
+                    "description": spec.description,
+                    "full_name": spec.full_name,
+                }
+                for spec in results
+            ],
+        }
         click.echo(json.dumps(data, indent=2))
-    else:
-        click.echo(f"Searching for: {query}")
-        click.echo("-" * 40)
+        return
 
-        if not results:
-            click.echo("No components found.")
-            return
+    # Only 20 hits are shown, so stop the search at the 21st
+    head = list(islice(registry.search(query, source), SEARCH_DISPLAY_LIMIT + 1))
+    more = len(head) > SEARCH_DISPLAY_LIMIT
+    count = f"{SEARCH_DISPLAY_LIMIT}+" if more else str(len(head))
+    verbose_echo(ctx, f"Search returned {count} results")
+
+    click.echo(f"Searching for: {query}")
+    click.echo("-" * 40)
+
+    if not head:
+        click.echo("No components found.")
+        return
 
-        for spec in results[:20]:
-            click.echo(f"  [{spec.source}] {spec.name}")
-            if spec.description:
-                click.echo(f"      {spec.description}")
+    for spec in head[:SEARCH_DISPLAY_LIMIT]:
+        click.echo(f"  [{spec.source}] {spec.name}")
+        if spec.description:
+            click.echo(f"      {spec.description}")
 
-        if len(results) > 20:
-            click.echo(f"\n  ... and {len(results) - 20} more results")
+    if more:
+        click.echo("\n  ... more results (use --json for the full list)")
 
 
 def parse_validate_param(value: tuple[str, ...]) -> dict[str, Any]:
     """Parse KEY=VALUE parameter pairs into a dictionary."""
-    if not value:
-        return {}
-    params: dict[str, Any] = {}
-    for item in value:
-        if "=" not in item:
-            raise click.BadParameter(f"Invalid parameter format: {item}. Use KEY=VALUE")
-        key, val = item.split("=", 1)
-        # Try to convert to appropriate type
-        try:
-            params[key] = int(val)
-        except ValueError:
-            try:
-                params[key] = float(val)
-            except ValueError:
-                if val.lower() in ("true", "yes", "1"):
-                    params[key] = True
-                elif val.lower() in ("false", "no", "0"):
-                    params[key] = False
-                else:
-                    params[key] = val
-    return params
+    return parse_params(value)
 
 
 @lib.command("validate")
@@ -8,7 +8,7 @@ import shutil
 
 import click
 
-from semicad.cli import get_ctx_value, verbose_echo
+from semicad.cli import STL_QUALITIES, get_ctx_value, verbose_echo
 from semicad.templates import (
     TEMPLATES,
     remove_project,
@@ -646,7 +646,7 @@ def test(ctx: click.Context) -> None:
 )
 @click.option(
     "--quality", "-q",
-    type=click.Choice(["draft", "normal", "fine", "ultra"]),
+    type=click.Choice(STL_QUALITIES),
     default="normal",
     help="STL mesh quality",
 )
@@ -7,20 +7,27 @@ A Component is any CAD part that can be:
 - Positioned (in an assembly)
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
-import cadquery as cq
-
 if TYPE_CHECKING:
+    # Annotations only: importing CadQuery here would load OCP for every
+    # `import semicad`, including CLI commands that never build geometry.
+    import cadquery as cq
+
     from semicad.core.validation import ValidationResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComponentSpec:
     """Specification for a component - metadata without the geometry.
 
+    Specs are immutable and slotted: registries hold many of them and only
+    ever read their fields.
+
     Attributes:
         name: Short name of the component (e.g., "motor_2207").
         source: Source identifier (e.g., "custom", "cq_warehouse", "partcad").
@@ -88,7 +95,7 @@ class Component(ABC):
         self,
         max_dimension: float | None = None,
         min_dimension: float | None = None,
-    ) -> "ValidationResult":
+    ) -> ValidationResult:
         """
         Validate the component geometry.
 
@@ -140,14 +147,14 @@ class Component(ABC):
                 )],
             )
 
-    def translate(self, x: float = 0, y: float = 0, z: float = 0) -> "Component":
+    def translate(self, x: float = 0, y: float = 0, z: float = 0) -> Component:
         """Return a translated copy of this component."""
         translated = TranslatedComponent(self, x, y, z)
         return translated
 
     def rotate(
         self, axis: tuple[float, float, float], angle: float
-    ) -> "Component":
+    ) -> Component:
         """Return a rotated copy of this component.
 
         Args:
@@ -6,8 +6,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 
 @dataclass
 class Project:
@@ -40,6 +38,8 @@ class Project:
         """
         partcad_file = self.root / "partcad.yaml"
         if partcad_file.exists():
+            import yaml  # Only projects with a partcad.yaml pay for the import
+
             with open(partcad_file) as f:
                 self.config = yaml.safe_load(f) or {}
 
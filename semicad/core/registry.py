@@ -5,9 +5,17 @@ Open/Closed: New sources can be added without modifying this class.
 Dependency Inversion: Depends on ComponentSource abstraction, not concrete sources.
 """
 
+import hashlib
+import importlib
+import importlib.util
+import os
+import pickle
+import sys
+import time
 from collections import OrderedDict
 from collections.abc import Iterator
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from .component import Component, ComponentSpec
@@ -58,6 +66,14 @@ class ComponentSource:
         """Load a component by name with optional parameters."""
         raise NotImplementedError
 
+    @property
+    def listing_complete(self) -> bool:
+        """False if list_components() may be missing entries (e.g. a failed index).
+
+        Incomplete listings are never written to the registry catalogue.
+        """
+        return True
+
     def search(self, query: str) -> Iterator[ComponentSpec]:
         """Search components by name/description."""
         query_lower = query.lower()
@@ -265,16 +281,226 @@ class ComponentRegistry:
 _registry: ComponentRegistry | None = None
 
 
-def get_registry() -> ComponentRegistry:
-    """Get or create the global component registry."""
+# Default sources as name -> (module, class), imported only when needed
+_DEFAULT_SOURCES = {
+    "custom": ("semicad.sources.custom", "CustomSource"),
+    "cq_warehouse": ("semicad.sources.warehouse", "WarehouseSource"),
+    "cq_electronics": ("semicad.sources.electronics", "ElectronicsSource"),
+    "partcad": ("semicad.sources.partcad_source", "PartCADSource"),
+}
+
+# Installed packages whose contents change what the default sources list
+_CATALOG_PACKAGES = ("cq-warehouse", "cq-electronics", "partcad")
+
+# Seconds before a cached listing is relisted, for sources whose listing
+# comes from the network and can change without any local file changing
+_CATALOG_MAX_AGE = {"partcad": 24 * 60 * 60}
+
+
+class CatalogSource(ComponentSource):
+    """
+    A default source whose spec listing is cached on disk.
+
+    Built either from a cached listing (warm) or around a live source
+    (cold). Warm listing never imports CadQuery or the source's library;
+    anything else (get_component, source-specific helpers, and search on
+    sources that override it) creates the real source on first use.
+    A cold source is listed only when something asks for its specs, and
+    the result is saved if it is non-empty and complete.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        store: "_CatalogStore",
+        specs: list[ComponentSpec] | None = None,
+        custom_search: bool = False,
+        source: ComponentSource | None = None,
+    ):
+        self._name = name
+        self._store = store
+        self._specs = specs
+        self._source = source
+        if source is not None:
+            custom_search = type(source).search is not ComponentSource.search
+        self._custom_search = custom_search
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def source(self) -> ComponentSource:
+        """The real source, created on first access."""
+        if self._source is None:
+            module_name, class_name = _DEFAULT_SOURCES[self._name]
+            self._source = getattr(importlib.import_module(module_name), class_name)()
+        return self._source
+
+    def list_components(self) -> Iterator[ComponentSpec]:
+        if self._specs is None:
+            source = self.source
+            self._specs = list(source.list_components())
+            if self._specs and source.listing_complete:
+                self._store.save(self._name, self._specs, self._custom_search)
+        yield from self._specs
+
+    def get_component(self, name: str, **params: Any) -> Component:
+        return self.source.get_component(name, **params)
+
+    def search(self, query: str) -> Iterator[ComponentSpec]:
+        if self._custom_search:
+            return self.source.search(query)
+        return super().search(query)
+
+    def __getattr__(self, attr: str) -> Any:
+        # Source-specific helpers (e.g. list_fastener_sizes)
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.source, attr)
+
+
+class _CatalogStore:
+    """
+    On-disk spec listings, one pickle per default source.
+
+    Files live in $SEMICAD_CACHE_DIR (default $XDG_CACHE_HOME/semicad) and
+    are named by a key covering everything the default sources read when
+    listing: their own modules, scripts/components.py, ./partcad.yaml,
+    the installed library versions, the working directory (PartCAD
+    resolves packages from it) and the Python version (pickle format).
+    Saving a listing removes that source's files under other keys, and
+    listings in _CATALOG_MAX_AGE expire after the given number of seconds.
+    """
+
+    def __init__(self) -> None:
+        from importlib.metadata import PackageNotFoundError, version
+
+        key = hashlib.blake2b(digest_size=16)
+        key.update(f"{sys.version}\0{os.getcwd()}".encode())
+
+        files = sorted(Path(__file__).parent.parent.joinpath("sources").glob("*.py"))
+        try:
+            components = importlib.util.find_spec("scripts.components")
+        except ImportError:
+            components = None
+        if components is not None and components.origin:
+            files.append(Path(components.origin))
+        for path in files:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            key.update(f"\0{path}:{st.st_mtime_ns}:{st.st_size}".encode())
+
+        try:
+            key.update(b"\0partcad.yaml=" + Path("partcad.yaml").read_bytes())
+        except OSError:
+            key.update(b"\0partcad.yaml=")
+
+        for package in _CATALOG_PACKAGES:
+            try:
+                key.update(f"\0{package}={version(package)}".encode())
+            except PackageNotFoundError:
+                key.update(f"\0{package}=".encode())
+
+        cache_dir = os.environ.get("SEMICAD_CACHE_DIR")
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        self.directory: Path = (
+            Path(cache_dir) if cache_dir
+            else (Path(xdg) if xdg else Path.home() / ".cache") / "semicad"
+        )
+        self.key = key.hexdigest()
+
+    def path(self, name: str) -> Path:
+        """Catalogue file for one source."""
+        return self.directory / f"registry-{self.key}-{name}.pkl"
+
+    def load(self, name: str) -> tuple[list[ComponentSpec], bool] | None:
+        """Return (specs, custom_search) for a source, or None on a miss."""
+        max_age = _CATALOG_MAX_AGE.get(name)
+        try:
+            with open(self.path(name), "rb") as f:
+                if max_age is not None and time.time() - os.fstat(f.fileno()).st_mtime > max_age:
+                    return None  # Expired: relist and overwrite it
+                specs, custom_search = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (
+            OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+            TypeError, ValueError,
+        ):
+            return None  # Unreadable or stale entry: relist and overwrite it
+        return specs, custom_search
+
+    def save(self, name: str, specs: list[ComponentSpec], custom_search: bool) -> None:
+        """Write one source's listing; best effort, never raises."""
+        path = self.path(name)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent CLI runs never read a partial file
+            with open(tmp, "wb") as f:
+                pickle.dump((specs, custom_search), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Unpicklable spec metadata or read-only cache dir: skip caching
+            tmp.unlink(missing_ok=True)
+            return
+
+        # Listings under older keys (edits, upgrades, other directories)
+        # are never read again; drop them so the cache dir doesn't grow
+        for old in self.directory.glob(f"registry-*-{name}.pkl"):
+            if old != path:
+                old.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete every cached listing, for all keys."""
+        for path in self.directory.glob("registry-*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+def get_registry(refresh: bool = False) -> ComponentRegistry:
+    """
+    Get or create the global component registry.
+
+    Source listings are cached on disk (see _CatalogStore), so on a warm
+    cache the default sources are only imported when a component is built.
+
+    Args:
+        refresh: Drop the cached listings and rebuild the registry. Setting
+            SEMICAD_REFRESH_CATALOG=1 in the environment does the same.
+    """
     global _registry
-    if _registry is None:
+    refresh = refresh or os.environ.get("SEMICAD_REFRESH_CATALOG", "") not in ("", "0")
+    if _registry is None or refresh:
+        store = _CatalogStore()
+        if refresh:
+            store.clear()
         _registry = ComponentRegistry()
-        _init_default_sources(_registry)
+        _init_default_sources(_registry, store)
     return _registry
 
 
-def _init_default_sources(registry: ComponentRegistry) -> None:
+def _create_default_source(name: str) -> ComponentSource | None:
+    """Instantiate one default source, or None if it is unavailable."""
+    import logging
+
+    module_name, class_name = _DEFAULT_SOURCES[name]
+    try:
+        source: ComponentSource = getattr(importlib.import_module(module_name), class_name)()
+    except ImportError as e:
+        # Dependency missing (expected if the library isn't in use)
+        logging.debug("%s source not available: %s", name, e)
+        return None
+    except (OSError, RuntimeError) as e:
+        # OSError: file access issues; RuntimeError: initialization failed
+        logging.debug("%s source initialization failed: %s", name, e)
+        return None
+    return source
+
+
+def _init_default_sources(registry: ComponentRegistry, store: _CatalogStore | None = None) -> None:
     """Initialize registry with default sources.
 
     Sources are loaded on a best-effort basis. If a source's dependencies
@@ -286,43 +512,21 @@ def _init_default_sources(registry: ComponentRegistry) -> None:
     2. warehouse - Requires cq_warehouse (fasteners, bearings)
     3. electronics - Requires cq_electronics (boards, connectors)
     4. partcad - Requires partcad (package manager)
-    """
-    # Import here to avoid circular imports
-    from semicad.sources import custom, electronics, partcad_source, warehouse
 
-    try:
-        registry.register_source(custom.CustomSource())
-    except (ImportError, OSError, RuntimeError) as e:
-        # ImportError: dependency missing
-        # OSError: file access issues
-        # RuntimeError: initialization failed
-        import logging
-
-        logging.debug("Custom source not available: %s", e)
-
-    try:
-        registry.register_source(warehouse.WarehouseSource())
-    except ImportError:
-        pass  # cq_warehouse not installed (expected if not using fasteners)
-    except (OSError, RuntimeError) as e:
-        import logging
-
-        logging.debug("Warehouse source initialization failed: %s", e)
-
-    try:
-        registry.register_source(electronics.ElectronicsSource())
-    except ImportError:
-        pass  # cq_electronics not installed (expected if not using electronics)
-    except (OSError, RuntimeError) as e:
-        import logging
-
-        logging.debug("Electronics source initialization failed: %s", e)
-
-    try:
-        registry.register_source(partcad_source.PartCADSource())
-    except ImportError:
-        pass  # PartCAD not installed (expected if not using package manager)
-    except (OSError, RuntimeError) as e:
-        import logging
-
-        logging.debug("PartCAD source initialization failed: %s", e)
+    With a catalogue store, sources with a cached listing are registered
+    without being imported, and the rest are wrapped so their listing is
+    cached the first time it is needed.
+    """
+    for name in _DEFAULT_SOURCES:
+        cached = store.load(name) if store is not None else None
+        if store is not None and cached is not None:
+            specs, custom_search = cached
+            registry.register_source(CatalogSource(name, store, specs, custom_search))
+            continue
+
+        source = _create_default_source(name)
+        if source is None:
+            continue
+        if store is not None:
+            source = CatalogSource(name, store, source=source)
+        registry.register_source(source)
@@ -63,6 +63,22 @@ class ValidationResult:
         return sum(1 for i in self.issues if i.severity == IssueSeverity.WARNING)
 
 
+def _count_subshapes(shape: "cq.Shape", kind: str) -> int:
+    """Count distinct sub-shapes of a kind ("SOLID", "FACE") without wrapping them.
+
+    Same result as len(shape.Solids()) / len(shape.Faces()), but skips
+    creating a CadQuery object per sub-shape, which dominates on large
+    assemblies.
+    """
+    from OCP.TopAbs import TopAbs_ShapeEnum
+    from OCP.TopExp import TopExp
+    from OCP.TopTools import TopTools_IndexedMapOfShape
+
+    shape_map = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape.wrapped, getattr(TopAbs_ShapeEnum, f"TopAbs_{kind}"), shape_map)
+    return int(shape_map.Extent())
+
+
 # Validation thresholds (in mm)
 MAX_DIMENSION = 2000.0  # Maximum reasonable dimension
 MIN_DIMENSION = 0.01    # Minimum reasonable dimension
@@ -128,8 +144,7 @@ def validate_geometry(
 
     # Check 2: Count solids
     try:
-        solids = shape.Solids()  # type: ignore[union-attr]
-        solid_count = len(solids)
+        solid_count = _count_subshapes(shape, "SOLID")  # type: ignore[arg-type]
         if solid_count == 0:
             issues.append(ValidationIssue(
                 severity=IssueSeverity.ERROR,
@@ -142,8 +157,7 @@ def validate_geometry(
 
     # Check 3: Count faces
     try:
-        faces = shape.Faces()  # type: ignore[union-attr]
-        face_count = len(faces)
+        face_count = _count_subshapes(shape, "FACE")  # type: ignore[arg-type]
         if face_count == 0 and solid_count > 0:
             issues.append(ValidationIssue(
                 severity=IssueSeverity.WARNING,
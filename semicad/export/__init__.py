@@ -56,6 +56,7 @@ from semicad.export.stl import (
     export_stl,
     get_quality_info,
     list_quality_presets,
+    mesh_model,
 )
 
 __all__ = [
@@ -82,6 +83,7 @@ __all__ = [
     "generate_bom",
     "get_quality_info",
     "list_quality_presets",
+    "mesh_model",
     "render_model_to_png",
     "render_stl_to_png",
     "render_stl_to_png_blender",
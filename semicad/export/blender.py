@@ -0,0 +1,74 @@
+"""
+Blender Render Script - Render an STL to PNG with Blender's bpy.
+
+Used in-process when the bpy package is installed, and otherwise run by
+Blender itself as `blender -b -P blender.py -- <stl> <png> <resolution>`.
+Only the standard library is imported at module level, since Blender's
+Python has no CadQuery.
+"""
+
+import math
+from pathlib import Path
+
+
+def render_stl(stl_path: str | Path, output_path: str | Path, resolution: int = 800) -> None:
+    """
+    Render an STL file to a square PNG in the current Blender session.
+
+    Requires bpy: either Blender's bundled Python or the ``bpy`` package
+    from PyPI.
+
+    Args:
+        stl_path: Path to STL file.
+        output_path: Path for output PNG.
+        resolution: Image size (square).
+    """
+    import bpy
+
+    # Clear scene
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    # Import STL
+    try:
+        bpy.ops.wm.stl_import(filepath=str(stl_path))
+    except AttributeError:
+        bpy.ops.import_mesh.stl(filepath=str(stl_path))
+
+    obj = bpy.context.selected_objects[0] if bpy.context.selected_objects else bpy.data.objects[-1]
+
+    # Center and scale
+    bpy.ops.object.origin_set(type="ORIGIN_GEOMETRY", center="BOUNDS")
+    scale = 1.0 / max(obj.dimensions)
+    obj.scale = (scale, scale, scale)
+    obj.location = (0, 0, 0)
+
+    # Add camera
+    cam_data = bpy.data.cameras.new("Camera")
+    cam = bpy.data.objects.new("Camera", cam_data)
+    bpy.context.scene.collection.objects.link(cam)
+    bpy.context.scene.camera = cam
+    cam.location = (2, 2, 1.5)
+    cam.rotation_euler = (math.radians(60), 0, math.radians(45))
+
+    # Add light
+    light_data = bpy.data.lights.new("Light", type="SUN")
+    light = bpy.data.objects.new("Light", light_data)
+    bpy.context.scene.collection.objects.link(light)
+    light.location = (3, 3, 5)
+
+    # Render settings
+    bpy.context.scene.render.resolution_x = resolution
+    bpy.context.scene.render.resolution_y = resolution
+    bpy.context.scene.render.filepath = str(output_path)
+    bpy.context.scene.render.image_settings.file_format = "PNG"
+
+    # Render
+    bpy.ops.render.render(write_still=True)
+
+
+if __name__ == "__main__":
+    # Run by Blender: blender -b -P blender.py -- <stl> <png> <resolution>
+    import sys
+
+    argv = sys.argv[sys.argv.index("--") + 1 :]
+    render_stl(argv[0], argv[1], int(argv[2]))
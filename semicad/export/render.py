@@ -7,12 +7,22 @@ Supports multiple rendering backends:
 - Blender - High-quality renders (requires external Blender installation)
 """
 
+import contextlib
+import hashlib
+import importlib.util
+import io
+import json
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import cadquery as cq
+from OCP.BRepTools import BRepTools
+from OCP.TopTools import TopTools_FormatVersion
 
 
 @dataclass
@@ -28,6 +38,9 @@ class RenderOptions:
     height: int = 600
 
 
+# Script passed to `blender -P` when bpy can't be imported in-process
+BLENDER_SCRIPT = Path(__file__).parent / "blender.py"
+
 # Standard orthographic views
 STANDARD_VIEWS = {
     "top": (0, 0, 1),  # Looking down Z
@@ -47,6 +60,10 @@ def export_svg_views(
     views: list[str] | None = None,
     width: int = 800,
     height: int = 600,
+    *,
+    max_workers: int = 1,
+    skip_unchanged: bool = False,
+    force: bool = False,
 ) -> dict[str, Path]:
     """
     Export orthographic SVG views of a CadQuery model.
@@ -59,6 +76,16 @@ def export_svg_views(
         views: List of view names to export. Default: ["top", "front", "right", "iso"]
         width: SVG width in pixels.
         height: SVG height in pixels.
+        max_workers: Processes used to render views in parallel.
+            Default 1 renders in this process; pass e.g. os.cpu_count()
+            to opt in to a process pool.
+        skip_unchanged: Record a key of the model and size per view in
+            ``<prefix>_views.json``, and skip a view when its SVG exists
+            and neither the key nor the SVG has changed since. Off by
+            default: every view is rendered and the JSON file is neither
+            read nor written.
+        force: With skip_unchanged, re-render every view and refresh the
+            recorded keys.
 
     Returns:
         Dict mapping view name to file path.
@@ -75,34 +102,108 @@ def export_svg_views(
     if views is None:
         views = ["top", "front", "right", "iso"]
 
-    exported = {}
-
+    jobs = {}
     for view_name in views:
         if view_name not in STANDARD_VIEWS:
             print(f"  Unknown view '{view_name}', skipping. Available: {list(STANDARD_VIEWS.keys())}")
             continue
 
-        direction = STANDARD_VIEWS[view_name]
-        output_path = output_dir / f"{base_name}_{view_name}.svg"
+        opt = {
+            "width": width,
+            "height": height,
+            "projectionDir": STANDARD_VIEWS[view_name],
+            "showAxes": False,
+            "showHidden": False,
+        }
+        jobs[view_name] = (output_dir / f"{base_name}_{view_name}.svg", opt)
+
+    # Build the compound once instead of once per view
+    shape = cq.Compound.makeCompound([v for v in model.vals() if isinstance(v, cq.Shape)])
+
+    order = list(jobs)
+    exported = {}
 
+    # Skip views already rendered from identical geometry at this size.
+    # The SVG's mtime is recorded too, so a file rewritten since is redone.
+    keys: dict[str, str] = {}
+    if skip_unchanged:
+        key = hashlib.sha256(_brep_bytes(shape) + f"{width}x{height}".encode()).hexdigest()
+        keys_path = output_dir / f"{base_name}_views.json"
         try:
-            cq.exporters.export(
-                model,
-                str(output_path),
-                exportType="SVG",
-                opt={
-                    "width": width,
-                    "height": height,
-                    "projectionDir": direction,
-                    "showAxes": False,
-                    "showHidden": False,
-                },
-            )
-            exported[view_name] = output_path
-        except Exception as e:
-            print(f"  Failed {view_name}: {e}")
+            keys = json.loads(keys_path.read_text())
+        except (OSError, ValueError):
+            keys = {}
+        if not force:
+            for view_name, (output_path, _) in list(jobs.items()):
+                recorded = keys.get(view_name)
+                if recorded is not None and recorded == _view_key(key, output_path):
+                    exported[view_name] = output_path
+                    del jobs[view_name]
+
+    max_workers = min(len(jobs), max_workers)
+
+    if max_workers <= 1:
+        for view_name, (output_path, opt) in jobs.items():
+            try:
+                _export_svg(shape, output_path, opt)
+                exported[view_name] = output_path
+            except Exception as e:
+                print(f"  Failed {view_name}: {e}")
+    else:
+        # Hidden-line removal holds the GIL, so views run in worker
+        # processes. Shapes don't pickle; the workers get the BREP.
+        brep = _brep_bytes(shape)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                view_name: executor.submit(_export_svg_from_brep, brep, output_path, opt)
+                for view_name, (output_path, opt) in jobs.items()
+            }
+            for view_name, future in futures.items():
+                try:
+                    future.result()
+                    exported[view_name] = jobs[view_name][0]
+                except Exception as e:
+                    print(f"  Failed {view_name}: {e}")
+
+    if skip_unchanged and jobs:
+        for view_name in jobs:
+            view_key = _view_key(key, exported[view_name]) if view_name in exported else None
+            if view_key is not None:
+                keys[view_name] = view_key
+            else:
+                keys.pop(view_name, None)
+        # Best effort: the SVGs are written; the next run renders them again
+        with contextlib.suppress(OSError):
+            keys_path.write_text(json.dumps(keys, indent=2))
+
+    return {view_name: exported[view_name] for view_name in order if view_name in exported}
+
+
+def _view_key(key: str, output_path: Path) -> str | None:
+    """Geometry key plus the SVG's mtime, or None if the SVG is missing."""
+    try:
+        return f"{key}:{output_path.stat().st_mtime_ns}"
+    except OSError:
+        return None
+
 
-    return exported
+def _brep_bytes(shape: cq.Shape) -> bytes:
+    """Serialize a shape to BREP without triangulation (deterministic)."""
+    buffer = io.BytesIO()
+    BRepTools.Write_s(
+        shape.wrapped, buffer, False, False, TopTools_FormatVersion.TopTools_FormatVersion_CURRENT
+    )
+    return buffer.getvalue()
+
+
+def _export_svg(shape: cq.Shape, output_path: Path, opt: dict[str, Any]) -> None:
+    """Write one SVG view of a shape."""
+    cq.exporters.export(shape, str(output_path), exportType="SVG", opt=opt)
+
+
+def _export_svg_from_brep(brep: bytes, output_path: Path, opt: dict[str, Any]) -> None:
+    """Write one SVG view of a BREP-serialized shape (process pool entry point)."""
+    _export_svg(cq.Shape.importBrep(io.BytesIO(brep)), output_path, opt)
 
 
 def render_stl_to_png(
@@ -129,12 +230,26 @@ def render_stl_to_png(
         >>> render_stl_to_png("part.stl", "part.png")
         Path('part.png')
     """
+    return _render_with_trimesh(stl_path, output_path, width, height)
+
+
+def _render_with_trimesh(
+    source: str | Path | cq.Shape,
+    output_path: str | Path,
+    width: int,
+    height: int,
+) -> Path | None:
+    """Render an STL file, or a shape tessellated in memory, with trimesh."""
     try:
         from typing import cast
 
         import trimesh
 
-        mesh = cast("trimesh.Trimesh", trimesh.load(str(stl_path)))
+        if isinstance(source, cq.Shape):
+            vertices, triangles = source.tessellate(0.1, 0.1)
+            mesh = trimesh.Trimesh(vertices=[v.toTuple() for v in vertices], faces=triangles)
+        else:
+            mesh = cast("trimesh.Trimesh", trimesh.load(str(source)))
         scene = mesh.scene()
         png_data = scene.save_image(resolution=[width, height])
 
@@ -162,7 +277,9 @@ def render_stl_to_png_blender(
     """
     Render STL to PNG using Blender.
 
-    Requires Blender to be installed and available in PATH.
+    Renders in-process when the ``bpy`` package is installed, which skips
+    Blender's startup cost on every call. Otherwise requires Blender to be
+    installed and available in PATH.
 
     Args:
         stl_path: Path to STL file.
@@ -179,72 +296,32 @@ def render_stl_to_png_blender(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Check if Blender is available
-    try:
-        subprocess.run(["blender", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if _bpy_available():
+        from semicad.export.blender import render_stl
+
+        try:
+            render_stl(stl_path, output_path, resolution)
+        except Exception as e:
+            print(f"Blender render failed: {e}")
+            return None
+        return output_path if output_path.exists() else None
+
+    if not _blender_available():
         print("Blender not found in PATH")
         return None
 
-    # Blender script for rendering
-    blender_script = f'''
-import bpy
-import math
-
-# Clear scene
-bpy.ops.wm.read_factory_settings(use_empty=True)
-
-# Import STL
-try:
-    bpy.ops.wm.stl_import(filepath="{stl_path}")
-except:
-    bpy.ops.import_mesh.stl(filepath="{stl_path}")
-
-obj = bpy.context.selected_objects[0] if bpy.context.selected_objects else bpy.data.objects[-1]
-
-# Center and scale
-bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-scale = 1.0 / max(obj.dimensions)
-obj.scale = (scale, scale, scale)
-obj.location = (0, 0, 0)
-
-# Add camera
-cam_data = bpy.data.cameras.new("Camera")
-cam = bpy.data.objects.new("Camera", cam_data)
-bpy.context.scene.collection.objects.link(cam)
-bpy.context.scene.camera = cam
-cam.location = (2, 2, 1.5)
-cam.rotation_euler = (math.radians(60), 0, math.radians(45))
-
-# Add light
-light_data = bpy.data.lights.new("Light", type='SUN')
-light = bpy.data.objects.new("Light", light_data)
-bpy.context.scene.collection.objects.link(light)
-light.location = (3, 3, 5)
-
-# Render settings
-bpy.context.scene.render.resolution_x = {resolution}
-bpy.context.scene.render.resolution_y = {resolution}
-bpy.context.scene.render.filepath = "{output_path}"
-bpy.context.scene.render.image_settings.file_format = 'PNG'
-
-# Render
-bpy.ops.render.render(write_still=True)
-'''
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(blender_script)
-        script_path = f.name
-
+    # Run the render module as a static Blender script; paths go in argv
     try:
         result = subprocess.run(
-            ["blender", "-b", "-P", script_path],
+            [
+                "blender", "-b", "-P", str(BLENDER_SCRIPT),
+                "--", str(stl_path), str(output_path), str(resolution),
+            ],
             capture_output=True,
             text=True,
             timeout=60,
             check=False,
         )
-        Path(script_path).unlink()
 
         if output_path.exists():
             return output_path
@@ -254,10 +331,25 @@ bpy.ops.render.render(write_still=True)
 
     except Exception as e:
         print(f"Blender render failed: {e}")
-        Path(script_path).unlink(missing_ok=True)
         return None
 
 
+@lru_cache(maxsize=1)
+def _bpy_available() -> bool:
+    """Whether Blender's Python module can be imported in this process."""
+    return importlib.util.find_spec("bpy") is not None
+
+
+@lru_cache(maxsize=1)
+def _blender_available() -> bool:
+    """Whether a Blender executable runs from PATH (checked once per process)."""
+    try:
+        subprocess.run(["blender", "--version"], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+    return True
+
+
 def render_model_to_png(
     model: cq.Workplane,
     output_path: str | Path,
@@ -268,7 +360,8 @@ def render_model_to_png(
     """
     Render a CadQuery model directly to PNG.
 
-    This exports to a temporary STL, then renders it.
+    trimesh renders the model's tessellation in memory. Blender needs a
+    file, so for it the model is exported to a temporary STL first.
 
     Args:
         model: CadQuery Workplane to render.
@@ -283,19 +376,17 @@ def render_model_to_png(
     Example:
         >>> render_model_to_png(model, "preview.png")
     """
+    if method != "blender":
+        # trimesh takes the tessellation directly; no STL round trip
+        shape = cq.Compound.makeCompound([v for v in model.vals() if isinstance(v, cq.Shape)])
+        return _render_with_trimesh(shape, output_path, width, height)
+
     with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as f:
         stl_path = Path(f.name)
 
     try:
-        # Export to temp STL
+        # Blender imports from disk, so it needs a temp STL
         cq.exporters.export(model, str(stl_path))
-
-        # Render based on method
-        if method == "blender":
-            result = render_stl_to_png_blender(stl_path, output_path, resolution=max(width, height))
-        else:
-            result = render_stl_to_png(stl_path, output_path, width, height)
-
-        return result
+        return render_stl_to_png_blender(stl_path, output_path, resolution=max(width, height))
     finally:
         stl_path.unlink(missing_ok=True)
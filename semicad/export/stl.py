@@ -7,9 +7,14 @@ Quality settings control the mesh density vs file size tradeoff.
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import cadquery as cq
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+from OCP.StlAPI import StlAPI_Writer
+
+from semicad.core.exceptions import ExportFormatError
 
 
 class STLQuality(Enum):
@@ -48,6 +53,68 @@ QUALITY_PRESETS: dict[STLQuality, STLOptions] = {
 }
 
 
+def _resolve_tolerances(
+    quality: STLQuality,
+    tolerance: float | None,
+    angular_tolerance: float | None,
+) -> tuple[float, float]:
+    """Return (linear, angular) tolerances from a preset plus optional overrides."""
+    options = QUALITY_PRESETS[quality]
+    tol = tolerance if tolerance is not None else options.tolerance
+    ang_tol = angular_tolerance if angular_tolerance is not None else options.angular_tolerance
+    return tol, ang_tol
+
+
+@lru_cache(maxsize=2)
+def _get_stl_writer(ascii: bool) -> StlAPI_Writer:
+    """Return the shared STL writer for the given mode.
+
+    StlAPI_Writer holds no per-file state, so one instance per mode is
+    reused across exports. (STEP writers are not shared: a
+    STEPControl_Writer accumulates every shape transferred to it.)
+    """
+    writer = StlAPI_Writer()
+    writer.ASCIIMode = ascii
+    return writer
+
+
+def mesh_model(
+    model: cq.Workplane,
+    quality: STLQuality = STLQuality.NORMAL,
+    tolerance: float | None = None,
+    angular_tolerance: float | None = None,
+) -> cq.Workplane:
+    """
+    Tessellate a model in place so later STL exports can reuse the mesh.
+
+    OCCT stores the triangulation on the shape's faces. A later export_stl()
+    with the same quality finds it and skips meshing, as does any compound
+    or moved copy that shares those faces.
+
+    Args:
+        model: CadQuery Workplane to mesh.
+        quality: Quality preset (DRAFT, NORMAL, FINE, ULTRA).
+        tolerance: Override preset's linear tolerance (optional).
+        angular_tolerance: Override preset's angular tolerance (optional).
+
+    Returns:
+        The same Workplane, for chaining.
+
+    Example:
+        >>> from semicad.export import mesh_model, export_stl, STLQuality
+        >>> mesh_model(model, quality=STLQuality.FINE)
+        >>> export_stl(model, "part.stl", quality=STLQuality.FINE)  # no re-mesh
+    """
+    tol, ang_tol = _resolve_tolerances(quality, tolerance, angular_tolerance)
+
+    # Same settings CadQuery's STL exporter uses (relative, parallel)
+    for shape in model.vals():
+        if isinstance(shape, cq.Shape):
+            BRepMesh_IncrementalMesh(shape.wrapped, tol, True, ang_tol, True)
+
+    return model
+
+
 def export_stl(
     model: cq.Workplane,
     output_path: str | Path,
@@ -78,21 +145,14 @@ def export_stl(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Get base options from preset
-    options = QUALITY_PRESETS[quality]
-
-    # Override with explicit values if provided
-    tol = tolerance if tolerance is not None else options.tolerance
-    ang_tol = angular_tolerance if angular_tolerance is not None else options.angular_tolerance
+    # Mesh (no-op if already meshed at this quality), then write the
+    # triangulation with a shared writer as cq.exporters.export would.
+    mesh_model(model, quality, tolerance, angular_tolerance)
+    shapes = [v for v in model.vals() if isinstance(v, cq.Shape)]
+    shape = shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
 
-    # Export using CadQuery
-    cq.exporters.export(
-        model,
-        str(output_path),
-        exportType="STL",
-        tolerance=tol,
-        angularTolerance=ang_tol,
-    )
+    if not _get_stl_writer(ascii).Write(shape.wrapped, str(output_path)):
+        raise ExportFormatError("STL", output_path.stem, str(output_path))
 
     return output_path
 
@@ -3,8 +3,19 @@ Component Sources - Adapters for different component libraries.
 
 Each source adapts a library to the ComponentSource interface,
 following the Adapter pattern and Dependency Inversion principle.
+
+Submodules are imported on first use: most sources pull in CadQuery
+or their library at import time, and a cached registry catalogue may
+only need one of them (or none).
 """
 
-from . import custom, electronics, partcad_source, warehouse
+import importlib
+from typing import Any
 
 __all__ = ["custom", "electronics", "partcad_source", "warehouse"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,15 +11,20 @@ Note: PartCAD CLI has compatibility issues with current Click version,
 so we use the Python API exclusively.
 """
 
-import logging
-from collections.abc import Iterator
-from typing import Any
+from __future__ import annotations
 
-import cadquery as cq
+import logging
+from typing import TYPE_CHECKING, Any
 
 from semicad.core.component import Component, ComponentSpec
 from semicad.core.registry import ComponentSource
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    # Only build() needs CadQuery; keep it out of catalogue searches
+    import cadquery as cq
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,6 +100,8 @@ class PartCADComponent(Component):
         else:
             solid = ctx.get_part_cadquery(self._partcad_path)
 
+        import cadquery as cq
+
         # Wrap the Solid in a Workplane for semicad compatibility
         return cq.Workplane("XY").newObject([solid])
 
@@ -134,11 +141,17 @@ class PartCADSource(ComponentSource):
         self._context: Any = None
         self._indexed_parts: dict[str, dict[str, Any]] = {}  # path -> config
         self._initialized = False
+        self._index_failed = False  # Any package (or the context) failed to index
 
     @property
     def name(self) -> str:
         return "partcad"
 
+    @property
+    def listing_complete(self) -> bool:
+        self._ensure_indexed()
+        return not self._index_failed
+
     def _get_context(self) -> Any:
         """Lazy-load PartCAD context."""
         if self._context is None:
@@ -171,12 +184,14 @@ class PartCADSource(ComponentSource):
                             }
                 except Exception as e:
                     logger.debug(f"Failed to index package {package_path}: {e}")
+                    self._index_failed = True
                     continue
 
             self._initialized = True
 
         except Exception as e:
             logger.warning(f"Failed to index PartCAD packages: {e}")
+            self._index_failed = True
             self._initialized = True  # Don't retry on error
 
     def _get_category(self, part_name: str) -> str:
@@ -12,8 +12,6 @@ from pathlib import Path
 from string import Template
 from typing import Any
 
-import yaml
-
 # Available templates
 TEMPLATES = ["basic", "quadcopter", "enclosure"]
 
@@ -110,6 +108,8 @@ def update_root_partcad(project_root: Path, project_name: str) -> None:
         project_root: Root directory of the main project
         project_name: Name of the new sub-project
     """
+    import yaml  # Deferred: the CLI imports this module on every run
+
     partcad_path = project_root / "partcad.yaml"
 
     # Load existing or create new
@@ -149,6 +149,8 @@ def remove_from_partcad(project_root: Path, project_name: str) -> bool:
     Returns:
         True if the entry was found and removed, False if not found
     """
+    import yaml
+
     partcad_path = project_root / "partcad.yaml"
 
     if not partcad_path.exists():
@@ -225,6 +227,8 @@ def sync_partcad(project_root: Path) -> list[str]:
     Returns:
         List of project names that were removed
     """
+    import yaml
+
     partcad_path = project_root / "partcad.yaml"
 
     if not partcad_path.exists():
@@ -21,6 +21,12 @@ requires_cq_electronics = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the registry catalogue per test, out of the user's cache."""
+    monkeypatch.setenv("SEMICAD_CACHE_DIR", str(tmp_path / "semicad-cache"))
+
+
 @pytest.fixture
 def mock_cq_electronics(monkeypatch):
     """Mock cq_electronics for testing without the actual library installed."""
@@ -52,6 +52,15 @@ class TestComponentSpec:
         assert spec.description == "A simple screw"
         assert spec.metadata["weight"] == 0.5
 
+    def test_immutable(self):
+        """Test that spec fields cannot be reassigned or added."""
+        import dataclasses
+
+        spec = ComponentSpec(name="part", source="custom", category="test")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.name = "other"
+        assert not hasattr(spec, "__dict__")
+
 
 class ConcreteComponent(Component):
     """A concrete implementation of Component for testing."""
@@ -1,5 +1,8 @@
 """Tests for semicad.core.registry module."""
 
+import os
+import time
+
 import pytest
 from collections.abc import Iterator
 from unittest.mock import MagicMock
@@ -7,8 +10,10 @@ from unittest.mock import MagicMock
 import cadquery as cq
 
 from semicad.core.component import Component, ComponentSpec
+from semicad.core import registry as registry_module
 from semicad.core.registry import (
     CacheStats,
+    CatalogSource,
     ComponentRegistry,
     ComponentSource,
     _make_cache_key,
@@ -416,3 +421,149 @@ class TestRegistryErrorHandling:
         # Should find it in source2
         component = registry.get("unique_part")
         assert component.name == "unique_part"
+
+
+class TestRegistryCatalog:
+    """Tests for the on-disk spec catalogue behind get_registry()."""
+
+    @pytest.fixture
+    def fresh_registry(self, monkeypatch):
+        """Call get_registry() as a new process would."""
+        def make(**kwargs):
+            monkeypatch.setattr(registry_module, "_registry", None)
+            return registry_module.get_registry(**kwargs)
+        return make
+
+    class _StubSource(ComponentSource):
+        def __init__(self, specs, complete=True):
+            self._specs = specs
+            self._complete = complete
+
+        @property
+        def name(self) -> str:
+            return "stub"
+
+        @property
+        def listing_complete(self) -> bool:
+            return self._complete
+
+        def list_components(self) -> Iterator[ComponentSpec]:
+            yield from self._specs
+
+        def get_component(self, name, **params):
+            raise KeyError(name)
+
+    def test_cold_then_warm(self, fresh_registry):
+        """Test that a second process lists the same specs from the catalogue."""
+        cold = fresh_registry()
+        assert all(isinstance(s, CatalogSource) for s in cold._sources.values())
+        store = cold._sources["custom"]._store
+        assert not store.path("custom").exists()
+        cold_specs = list(cold.list_all())
+        assert store.path("custom").exists()
+
+        warm = fresh_registry()
+        assert warm.sources == cold.sources
+        assert list(warm.list_all()) == cold_specs
+        # Listing never built the real sources that had a saved listing
+        for name, source in warm._sources.items():
+            assert (source._source is None) == store.path(name).exists()
+
+    def test_get_does_not_list_other_sources(self, fresh_registry):
+        """Test that a cold get() only lists sources up to the match."""
+        registry = fresh_registry()
+        assert registry.get("motor_2207").name == "motor_2207"
+        others = [s for name, s in registry._sources.items() if name != "custom"]
+        assert all(s._specs is None for s in others)
+
+    def test_warm_get_builds_real_source(self, fresh_registry):
+        """Test that getting a component from the catalogue loads its source."""
+        list(fresh_registry().list_all())
+        warm = fresh_registry()
+        component = warm.get("motor_2207")
+        assert component.name == "motor_2207"
+        assert warm._sources["custom"]._source is not None
+
+    def test_incomplete_listing_not_saved(self, tmp_path):
+        """Test that failed or empty listings are served but never persisted."""
+        store = registry_module._CatalogStore()
+        spec = ComponentSpec(name="x", source="stub", category="test")
+        for source in (self._StubSource([spec], complete=False), self._StubSource([])):
+            catalog = CatalogSource("stub", store, source=source)
+            assert list(catalog.list_components()) == source._specs
+            assert not store.path("stub").exists()
+
+        catalog = CatalogSource("stub", store, source=self._StubSource([spec]))
+        list(catalog.list_components())
+        assert store.load("stub") == ([spec], False)
+
+    def test_save_drops_other_keys(self, tmp_path, monkeypatch):
+        """Test that saving a listing removes the same source's older files."""
+        old = registry_module._CatalogStore()
+        spec = ComponentSpec(name="x", source="stub", category="test")
+        old.save("stub", [spec], False)
+        old.save("other", [spec], False)
+
+        monkeypatch.chdir(tmp_path)
+        new = registry_module._CatalogStore()
+        new.save("stub", [spec], False)
+
+        assert not old.path("stub").exists()
+        assert old.path("other").exists()
+        assert new.load("stub") == ([spec], False)
+
+    def test_network_listing_expires(self, monkeypatch):
+        """Test that listings with a max age are relisted once it passes."""
+        monkeypatch.setitem(registry_module._CATALOG_MAX_AGE, "stub", 60)
+        store = registry_module._CatalogStore()
+        spec = ComponentSpec(name="x", source="stub", category="test")
+        store.save("stub", [spec], False)
+        assert store.load("stub") is not None
+
+        stale = time.time() - 120
+        os.utime(store.path("stub"), (stale, stale))
+        assert store.load("stub") is None
+
+    def test_key_changes_with_cwd(self, tmp_path, monkeypatch):
+        """Test that the catalogue is not shared across working directories."""
+        before = registry_module._CatalogStore().key
+        monkeypatch.chdir(tmp_path)
+        assert registry_module._CatalogStore().key != before
+
+    def test_key_changes_with_partcad_yaml(self, tmp_path, monkeypatch):
+        """Test that editing partcad.yaml invalidates the catalogue."""
+        monkeypatch.chdir(tmp_path)
+        before = registry_module._CatalogStore().key
+        (tmp_path / "partcad.yaml").write_text("dependencies: {}\n")
+        assert registry_module._CatalogStore().key != before
+
+    def test_cache_dir_from_xdg(self, tmp_path, monkeypatch):
+        """Test the default catalogue location when SEMICAD_CACHE_DIR is unset."""
+        monkeypatch.delenv("SEMICAD_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert registry_module._CatalogStore().directory == tmp_path / "semicad"
+
+    def test_corrupt_catalogue_rebuilt(self, fresh_registry):
+        """Test that an unreadable catalogue is relisted instead of raising."""
+        store = registry_module._CatalogStore()
+        store.directory.mkdir(parents=True, exist_ok=True)
+        store.path("custom").write_bytes(b"not a pickle")
+        registry = fresh_registry()
+        assert registry._sources["custom"]._specs is None
+        assert any(spec.name == "motor_2207" for spec in registry.list_from("custom"))
+        assert store.load("custom") is not None
+
+    @pytest.mark.parametrize("use_env", [False, True])
+    def test_refresh(self, fresh_registry, monkeypatch, use_env):
+        """Test that a refresh drops cached listings."""
+        list(fresh_registry().list_all())
+        store = registry_module._CatalogStore()
+        assert store.path("custom").exists()
+
+        if use_env:
+            monkeypatch.setenv("SEMICAD_REFRESH_CATALOG", "1")
+            registry = fresh_registry()
+        else:
+            registry = fresh_registry(refresh=True)
+        assert not store.path("custom").exists()
+        assert registry._sources["custom"]._specs is None
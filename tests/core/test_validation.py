@@ -0,0 +1,26 @@
+"""Tests for semicad.core.validation module."""
+
+import cadquery as cq
+
+from semicad.core.validation import _count_subshapes, validate_geometry
+
+
+class TestValidateGeometry:
+    """Tests for validate_geometry metrics."""
+
+    def test_counts_match_cadquery(self):
+        """Test that solid/face counts match CadQuery's Solids()/Faces()."""
+        geometry = cq.Workplane("XY").pushPoints([(0, 0), (20, 0)]).box(5, 5, 5)
+        shape = cq.Compound.makeCompound(geometry.vals())
+
+        assert _count_subshapes(shape, "SOLID") == len(shape.Solids()) == 2
+        assert _count_subshapes(shape, "FACE") == len(shape.Faces()) == 12
+
+    def test_single_box(self):
+        """Test metrics and validity for a plain box."""
+        result = validate_geometry(cq.Workplane("XY").box(10, 20, 30), name="box")
+
+        assert result.is_valid
+        assert result.solid_count == 1
+        assert result.face_count == 6
+        assert result.bbox_size == (10.0, 20.0, 30.0)
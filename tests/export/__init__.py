@@ -0,0 +1 @@
+"""Tests for semicad.export module."""
@@ -0,0 +1,122 @@
+"""Tests for semicad.export.render module."""
+
+from pathlib import Path
+
+from semicad.export import export_svg_views, render_stl_to_png_blender
+
+
+class TestExportSVGViews:
+    """Tests for export_svg_views()."""
+
+    def test_default_views(self, simple_workplane, temp_output_dir):
+        """Test that the four default views are written."""
+        exported = export_svg_views(simple_workplane, temp_output_dir / "part")
+        assert list(exported) == ["top", "front", "right", "iso"]
+        for path in exported.values():
+            assert path.read_text().lstrip().startswith("<?xml")
+
+    def test_unknown_view_skipped(self, simple_workplane, temp_output_dir):
+        """Test that unknown view names are skipped."""
+        exported = export_svg_views(
+            simple_workplane, temp_output_dir / "part", views=["top", "sideways"]
+        )
+        assert list(exported) == ["top"]
+
+    def test_parallel_matches_serial(self, simple_workplane, temp_output_dir):
+        """Test that views rendered in worker processes match in-process ones."""
+        views = ["top", "iso"]
+        serial = export_svg_views(simple_workplane, temp_output_dir / "serial", views=views)
+        parallel = export_svg_views(
+            simple_workplane, temp_output_dir / "parallel", views=views, max_workers=2
+        )
+        assert list(parallel) == views
+        for view in views:
+            assert parallel[view].read_text() == serial[view].read_text()
+
+    def test_no_views_json_by_default(self, simple_workplane, temp_output_dir):
+        """Test that only the SVGs are written unless skip_unchanged is set."""
+        export_svg_views(simple_workplane, temp_output_dir / "part", views=["top"])
+        assert sorted(p.name for p in temp_output_dir.iterdir()) == ["part_top.svg"]
+
+    def test_unchanged_views_skipped(self, simple_workplane, temp_output_dir):
+        """Test that views of an unchanged model are not rendered again."""
+        prefix = temp_output_dir / "part"
+        first = export_svg_views(simple_workplane, prefix, skip_unchanged=True)
+        assert (temp_output_dir / "part_views.json").exists()
+        mtimes = {view: path.stat().st_mtime_ns for view, path in first.items()}
+
+        again = export_svg_views(simple_workplane, prefix, skip_unchanged=True)
+        assert again == first
+        assert {view: path.stat().st_mtime_ns for view, path in again.items()} == mtimes
+
+    def test_changed_model_rerendered(self, simple_workplane, temp_output_dir):
+        """Test that a changed model, an edited SVG or a forced export renders again."""
+        prefix = temp_output_dir / "part"
+        path = temp_output_dir / "part_top.svg"
+        export_svg_views(simple_workplane, prefix, views=["top"], skip_unchanged=True)
+        original = path.read_text()
+
+        holed = simple_workplane.faces(">Z").workplane().hole(1)
+        export_svg_views(holed, prefix, views=["top"], skip_unchanged=True)
+        assert path.read_text() != original
+
+        export_svg_views(simple_workplane, prefix, views=["top"], skip_unchanged=True)
+        assert path.read_text() == original
+
+        path.write_text("edited")
+        export_svg_views(simple_workplane, prefix, views=["top"], skip_unchanged=True)
+        assert path.read_text() == original
+
+        mtime = path.stat().st_mtime_ns
+        export_svg_views(simple_workplane, prefix, views=["top"], skip_unchanged=True, force=True)
+        assert path.stat().st_mtime_ns != mtime
+
+    def test_unwritable_views_json(self, simple_workplane, temp_output_dir):
+        """Test that failing to record the keys does not fail the export."""
+        (temp_output_dir / "part_views.json").mkdir()
+        exported = export_svg_views(
+            simple_workplane, temp_output_dir / "part", views=["top"], skip_unchanged=True
+        )
+        assert list(exported) == ["top"]
+
+
+class TestRenderSTLToPNGBlender:
+    """Tests for render_stl_to_png_blender()."""
+
+    def test_renders_in_process_with_bpy(self, monkeypatch, temp_output_dir):
+        """Test that an importable bpy is used instead of a Blender subprocess."""
+        from semicad.export import blender, render
+
+        def fake_render_stl(stl_path, output_path, resolution):
+            output_path.write_bytes(b"png")
+
+        def no_subprocess(*args, **kwargs):
+            raise AssertionError("Blender subprocess started")
+
+        monkeypatch.setattr(render, "_bpy_available", lambda: True)
+        monkeypatch.setattr(blender, "render_stl", fake_render_stl)
+        monkeypatch.setattr(render.subprocess, "run", no_subprocess)
+
+        output = temp_output_dir / "part.png"
+        assert render_stl_to_png_blender(temp_output_dir / "part.stl", output) == output
+
+    def test_subprocess_passes_paths_as_arguments(self, monkeypatch, temp_output_dir):
+        """Test that the Blender fallback runs the static script with argv paths."""
+        from semicad.export import render
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            Path(cmd[cmd.index("--") + 2]).write_bytes(b"png")
+
+        monkeypatch.setattr(render, "_bpy_available", lambda: False)
+        monkeypatch.setattr(render, "_blender_available", lambda: True)
+        monkeypatch.setattr(render.subprocess, "run", fake_run)
+
+        stl = temp_output_dir / 'it\'s "quoted".stl'
+        output = temp_output_dir / "part.png"
+        assert render_stl_to_png_blender(stl, output, resolution=512) == output
+        assert calls == [
+            ["blender", "-b", "-P", str(render.BLENDER_SCRIPT), "--", str(stl), str(output), "512"]
+        ]
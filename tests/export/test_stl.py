@@ -0,0 +1,56 @@
+"""Tests for semicad.export.stl module."""
+
+import pytest
+
+from semicad.core.exceptions import ExportFormatError
+from semicad.export import STLQuality, export_stl, mesh_model
+
+
+class TestExportSTL:
+    """Tests for export_stl()."""
+
+    def test_binary_by_default(self, simple_workplane, temp_output_dir):
+        """Test that the default export is a binary STL."""
+        path = export_stl(simple_workplane, temp_output_dir / "part.stl")
+        data = path.read_bytes()
+        # Binary STL: 80-byte header, uint32 count, 50 bytes per triangle
+        count = int.from_bytes(data[80:84], "little")
+        assert len(data) == 84 + 50 * count
+        assert count > 0
+
+    def test_ascii_option(self, simple_workplane, temp_output_dir):
+        """Test that ascii=True writes a text STL."""
+        path = export_stl(simple_workplane, temp_output_dir / "part.stl", ascii=True)
+        assert path.read_text().lstrip().startswith("solid")
+
+    def test_binary_smaller_than_ascii(self, simple_workplane, temp_output_dir):
+        """Test that binary output is smaller than the ASCII equivalent."""
+        binary = export_stl(simple_workplane, temp_output_dir / "bin.stl")
+        text = export_stl(simple_workplane, temp_output_dir / "txt.stl", ascii=True)
+        assert binary.stat().st_size < text.stat().st_size
+
+    def test_write_failure_raises(self, simple_workplane, tmp_path):
+        """Test that an unwritable path raises ExportFormatError."""
+        target = tmp_path / "blocked.stl"
+        target.mkdir()
+        with pytest.raises(ExportFormatError):
+            export_stl(simple_workplane, target)
+
+
+class TestMeshModel:
+    """Tests for mesh_model()."""
+
+    def test_returns_same_workplane(self, simple_workplane):
+        """Test that mesh_model returns its input for chaining."""
+        assert mesh_model(simple_workplane, quality=STLQuality.DRAFT) is simple_workplane
+
+    def test_premeshed_export_matches(self, temp_output_dir):
+        """Test that exporting a pre-meshed model gives the same STL."""
+        import cadquery as cq
+
+        fresh = cq.Workplane("XY").cylinder(10, 5)
+        meshed = mesh_model(cq.Workplane("XY").cylinder(10, 5))
+
+        a = export_stl(fresh, temp_output_dir / "a.stl")
+        b = export_stl(meshed, temp_output_dir / "b.stl")
+        assert a.stat().st_size == b.stat().st_size
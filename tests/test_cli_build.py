@@ -0,0 +1,89 @@
+"""Tests for the build command."""
+
+import os
+import sys
+
+from click.testing import CliRunner
+
+from semicad.cli import cli
+
+
+def _make_project(tmp_path, script: str):
+    """Create a project whose build script runs the given source."""
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "quadcopter_assembly.py").write_text(script)
+    (tmp_path / "output").mkdir()
+    return tmp_path
+
+
+class TestBuild:
+    """Tests for the build command."""
+
+    def test_lists_outputs(self, tmp_path):
+        """Test that STEP files are listed before STL files, and nothing else."""
+        root = _make_project(
+            tmp_path,
+            "from pathlib import Path\n"
+            "for name in ('b.stl', 'a.step', 'notes.txt', 'c.step'):\n"
+            "    (Path('output') / name).write_text('')\n",
+        )
+
+        result = CliRunner().invoke(cli, ["--project", str(root), "build"])
+
+        assert result.exit_code == 0, result.output
+        listed = result.output.split("Output files:\n", 1)[1].split()
+        assert sorted(listed[:2]) == ["a.step", "c.step"]
+        assert listed[2:] == ["b.stl"]
+
+    def test_missing_output_dir(self, tmp_path):
+        """Test that an --output directory that does not exist lists nothing."""
+        root = _make_project(tmp_path, "pass\n")
+
+        result = CliRunner().invoke(
+            cli, ["--project", str(root), "build", "-o", str(root / "nope")]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert result.output.endswith("Output files:\n")
+
+    def test_no_build_script(self, tmp_path):
+        """Test that a project without a build script reports it."""
+        result = CliRunner().invoke(cli, ["--project", str(tmp_path), "build"])
+        assert "No build script found." in result.output
+
+    def test_runs_in_process(self, tmp_path):
+        """Test that the script runs as __main__ here, with paths and argv restored."""
+        root = _make_project(
+            tmp_path,
+            "import os, sys\n"
+            "assert __name__ == '__main__'\n"
+            "assert sys.argv[1:] == []\n"
+            "assert sys.path[0].endswith('scripts')\n"
+            "open(os.path.join('output', 'pid.step'), 'w').write(str(os.getpid()))\n",
+        )
+        saved = sys.path[:], sys.argv[:], os.getcwd()
+
+        result = CliRunner().invoke(cli, ["--project", str(root), "build"])
+
+        assert result.exit_code == 0, result.output
+        assert (root / "output" / "pid.step").read_text() == str(os.getpid())
+        assert (sys.path, sys.argv, os.getcwd()) == saved
+
+    def test_failing_script_skips_listing(self, tmp_path):
+        """Test that a non-zero exit or an exception skips the output listing."""
+        for script in ("import sys\nsys.exit(3)\n", "raise RuntimeError('boom')\n"):
+            root = tmp_path / str(len(script))
+            root.mkdir()
+            _make_project(root, script)
+
+            result = CliRunner().invoke(cli, ["--project", str(root), "build"])
+
+            assert "Build complete" not in result.output
+
+
+def test_quality_choices_match_enum():
+    """Test that the CLI quality choices stay in sync with STLQuality."""
+    from semicad.cli import STL_QUALITIES
+    from semicad.export import STLQuality
+
+    assert tuple(q.value for q in STLQuality) == STL_QUALITIES
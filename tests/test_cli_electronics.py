@@ -111,6 +111,37 @@ class TestParseValidateParam:
         result = parse_validate_param(["expr=a=b"])
         assert result["expr"] == "a=b"
 
+    def test_float_forms(self):
+        """Signed, fractional and exponent literals should become floats."""
+        from semicad.cli.commands.library import parse_validate_param
+
+        result = parse_validate_param(["a=-1.5", "b=.5", "c=2.", "d=1e3", "e=1e", "f=+3"])
+        assert result == {"a": -1.5, "b": 0.5, "c": 2.0, "d": 1000.0, "e": "1e", "f": 3}
+        assert isinstance(result["f"], int)
+
+    def test_int_float_fallback(self):
+        """Other forms int() and float() accept should still convert."""
+        import math
+
+        from semicad.cli.commands.library import parse_validate_param
+
+        result = parse_validate_param(["a= 5", "b=1_000", "c=inf", "d=nan", "e=1_0.5"])
+        assert result["a"] == 5
+        assert isinstance(result["a"], int)
+        assert result["b"] == 1000
+        assert isinstance(result["b"], int)
+        assert result["c"] == math.inf
+        assert math.isnan(result["d"])
+        assert result["e"] == 10.5
+
+    def test_shared_with_export(self):
+        """export and lib validate should parse parameters identically."""
+        from semicad.cli.commands.build import parse_param
+        from semicad.cli.commands.library import parse_validate_param
+
+        items = ("rows=2", "above=7.5", "flag=yes", "name=x")
+        assert parse_param(None, None, items) == parse_validate_param(items)
+
 
 class TestRegistryGetSpec:
     """Test registry.get_spec() method added in P2.5."""
@@ -0,0 +1,61 @@
+"""Tests for the library commands."""
+
+import json
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from semicad.cli import cli
+from semicad.core.component import ComponentSpec
+from semicad.core.registry import ComponentRegistry, ComponentSource
+
+
+class CountingSource(ComponentSource):
+    """Source with many matching specs that counts how many were listed."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.listed = 0
+
+    @property
+    def name(self) -> str:
+        return "counting"
+
+    def list_components(self):
+        for i in range(self.count):
+            self.listed += 1
+            yield ComponentSpec(name=f"bolt_{i}", source=self.name, category="fastener")
+
+
+def _invoke(args, source):
+    registry = ComponentRegistry()
+    registry.register_source(source)
+    with patch("semicad.core.registry.get_registry", return_value=registry):
+        return CliRunner().invoke(cli, args)
+
+
+class TestSearch:
+    """Tests for the search command."""
+
+    def test_stops_after_display_limit(self):
+        """Test that text output pulls only one hit past the 20 shown."""
+        source = CountingSource(100)
+        result = _invoke(["search", "bolt"], source)
+
+        assert result.exit_code == 0, result.output
+        assert result.output.count("[counting]") == 20
+        assert "more results" in result.output
+        assert source.listed == 21
+
+    def test_no_more_marker_when_all_shown(self):
+        """Test that no truncation line is printed for 20 or fewer hits."""
+        result = _invoke(["search", "bolt"], CountingSource(20))
+        assert result.output.count("[counting]") == 20
+        assert "more results" not in result.output
+
+    def test_json_lists_everything(self):
+        """Test that --json still reports every hit."""
+        result = _invoke(["--json", "search", "bolt"], CountingSource(30))
+        data = json.loads(result.output)
+        assert data["total"] == 30
+        assert len(data["results"]) == 30
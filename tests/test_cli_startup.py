@@ -0,0 +1,64 @@
+"""Tests for CLI startup cost."""
+
+import subprocess
+import sys
+
+
+def test_cli_import_does_not_load_cadquery():
+    """Test that importing the CLI leaves CadQuery unloaded until a command needs it."""
+    code = "import sys, semicad.cli; sys.exit('cadquery' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_help_and_completion_skip_heavy_imports():
+    """Test that --help and completion never import geometry, export or YAML modules."""
+    heavy = ["cadquery", "OCP", "trimesh", "semicad.export", "semicad.sources.custom", "yaml"]
+    for args in (["--help"], ["lib", "--help"], ["completion", "show", "bash"]):
+        code = (
+            "import sys\n"
+            "from semicad.cli import cli\n"
+            f"try:\n    cli({args!r}, prog_name='dev')\nexcept SystemExit:\n    pass\n"
+            f"loaded = [m for m in {heavy!r} if m in sys.modules]\n"
+            "sys.stderr.write(repr(loaded))\n"
+            "sys.exit(bool(loaded))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, (args, result.stderr)
+
+
+def test_project_free_command_skips_project(monkeypatch):
+    """Test that commands without a project context do not resolve one."""
+    from click.testing import CliRunner
+
+    import semicad.cli as cli_module
+
+    calls = []
+    monkeypatch.setattr(cli_module, "get_project", calls.append)
+
+    result = CliRunner().invoke(cli_module.cli, ["version"])
+    assert result.exit_code == 0
+    assert calls == []
+
+    CliRunner().invoke(cli_module.cli, ["build", "--help"])
+    assert len(calls) == 1
+
+
+def test_explicit_project_checked_for_project_free_command(tmp_path):
+    """Test that a bad --project is reported even when the command needs none."""
+    from click.testing import CliRunner
+
+    from semicad.cli import cli
+
+    (tmp_path / "partcad.yaml").write_text("dependencies: [unclosed\n")
+
+    result = CliRunner().invoke(cli, ["--project", str(tmp_path), "version"])
+    assert result.exit_code != 0
+
+    result = CliRunner().invoke(cli, ["--project", str(tmp_path / "nope"), "version"])
+    assert result.exit_code == 2
+    assert "does not exist" in result.output